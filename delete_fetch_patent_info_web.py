@@ -1,12 +1,57 @@
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 
-def fetch_patent_info(patent_number: str) -> dict:
+# Selectors are compiled once at import instead of on every call.
+_ABSTRACT_SEL = soupsieve.compile(".abstract")
+_DESCRIPTION_SEL = soupsieve.compile('section[itemprop="description"]')
+_CLAIMS_SEL = soupsieve.compile('section[itemprop="claims"]')
+
+# Only these sections are built into the tree; the ".abstract" div lives inside the abstract section.
+_SECTIONS_STRAINER = SoupStrainer("section", attrs={"itemprop": ["abstract", "description", "claims"]})
+
+def text_prefix(element, max_chars: int) -> str:
+    """
+    Returns element.text.strip()[:max_chars] without joining all of the element's text.
+
+    The text nodes are walked in order and the walk stops once max_chars characters
+    are known, so only a prefix of a long description or claims section is built.
+
+    Args:
+        element (bs4.element.Tag): The element to read.
+        max_chars (int): The number of characters to return.
+
+    Returns:
+        str: The first max_chars characters of the element's stripped text.
+    """
+    parts, length = [], 0
+    strings = element.strings
+    for string in strings:
+        if not parts:
+            string = string.lstrip()
+            if not string:
+                continue
+        parts.append(string)
+        length += len(string)
+        if length >= max_chars:
+            text = "".join(parts)
+            prefix = text[:max_chars]
+            # Trailing whitespace only survives strip() if more text follows it.
+            if prefix[-1:].isspace() and not text[max_chars:].strip() \
+                    and not any(rest.strip() for rest in strings):
+                prefix = prefix.rstrip()
+            return prefix
+    return "".join(parts).rstrip()
+
+def fetch_patent_info(patent_number: str, max_chars: int = None) -> dict:
     """
     Extracts the abstract, description, and claims from a Google Patents page.
 
     Args:
         patent_number (str): The patent number.
+        max_chars (int, optional): If given, only the first max_chars characters of each
+                                   text field are extracted, without building the full
+                                   text of long sections. Defaults to None (full text).
 
     Returns:
         dict: A dictionary containing the patent number, abstract, description, and claims.
@@ -20,18 +65,21 @@ def fetch_patent_info(patent_number: str) -> dict:
         print(f"Error fetching patent {patent_number}: {e}")
         return None
 
-    soup = BeautifulSoup(response.content, features="lxml")
+    # lxml is the C-backed parser; the page is always served as UTF-8 so skip
+    # the encoding detection pass as well, and skip building everything outside
+    # the sections we read.
+    soup = BeautifulSoup(response.content, "lxml", from_encoding="utf-8", parse_only=_SECTIONS_STRAINER)
 
     # Helper function to extract text, handling None
     def extract_text(selector):
-        element = soup.select_one(selector)
-        return element.text.strip() if element else None
-
-    abstract = extract_text(".abstract")
-    description_element = soup.find("section", {"itemprop": "description"})
-    description = description_element.text.strip() if description_element else None
-    claims_section = soup.find("section", {"itemprop": "claims"})
-    claims = claims_section.text.strip() if claims_section else None
+        element = selector.select_one(soup)
+        if not element:
+            return None
+        return text_prefix(element, max_chars) if max_chars is not None else element.text.strip()
+
+    abstract = extract_text(_ABSTRACT_SEL)
+    description = extract_text(_DESCRIPTION_SEL)
+    claims = extract_text(_CLAIMS_SEL)
 
     return {
         "patent_number": patent_number,
@@ -1,11 +1,30 @@
 # Scrape #
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 # json # 
-import json
+import orjson
 # errors #
 from .errors import *
 
+# ~ Selectors compiled once at import ~ #
+_ABSTRACT_SEL = soupsieve.compile(".abstract")
+
+def _txt(parent, *args, strip=False, **kwargs):
+    """Returns the text of parent.find(*args, **kwargs), or '' if nothing matches
+
+    Avoids raising and catching AttributeError for every missing field.
+
+    Inputs:
+        - parent (bs4 object) : element to search within
+        - strip  (bool)       : whether to strip surrounding whitespace from the text
+    """
+    element = parent.find(*args, **kwargs)
+    if element is None:
+        return ''
+    text = element.get_text()
+    return text.strip() if strip else text
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 #           Create scraper class
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
@@ -138,20 +157,11 @@ class scraper_class:
 
         """
 
-        try:
-            patent_number = single_citation.find('span',itemprop='publicationNumber').get_text()
-        except:
-            patent_number = ''
+        patent_number = _txt(single_citation,'span',itemprop='publicationNumber')
         # ~ Get priority date ~ #
-        try:
-            priority_date = single_citation.find('td',itemprop='priorityDate').get_text()
-        except:
-            priority_date = ''
+        priority_date = _txt(single_citation,'td',itemprop='priorityDate')
         # ~ Get publication date ~ # 
-        try:
-            publication_date = single_citation.find('td',itemprop='publicationDate').get_text()
-        except:
-            publication_date
+        publication_date = _txt(single_citation,'td',itemprop='publicationDate')
         return({'patent_number':patent_number,
                 'priority_date':priority_date,
                 'publication_date':publication_date})
@@ -190,50 +200,26 @@ class scraper_class:
         title = soup.find('meta',attrs={'name':'DC.title'})
         title_text=title['content'].rstrip()
 
-        try:
-            # inventor_name = [{'inventor_name':x.get_text()} for x in soup.find_all('dd',itemprop='inventor')]
-            inventor_name = [x.get_text() for x in soup.find_all('dd',itemprop='inventor')]
-        except:
-            inventor_name = []
+        # inventor_name = [{'inventor_name':x.get_text()} for x in soup.find_all('dd',itemprop='inventor')]
+        inventor_name = [x.get_text() for x in soup.find_all('dd',itemprop='inventor')]
         # Assignee #
-        try:
-            # assignee_name_orig = [{'assignee_name':x.get_text()} for x in soup.find_all('dd',itemprop='assigneeOriginal')]
-            assignee_name_orig = [x.get_text() for x in soup.find_all('dd',itemprop='assigneeOriginal')]
-        except:
-            assignee_name_orig = []
-        try:
-            # assignee_name_current = [{'assignee_name':x.get_text()} for x in soup.find_all('dd',itemprop='assigneeCurrent')]
-            assignee_name_current = [x.get_text().strip() for x in soup.find_all('dd',itemprop='assigneeCurrent')]
-        except:
-            assignee_name_current = []
+        # assignee_name_orig = [{'assignee_name':x.get_text()} for x in soup.find_all('dd',itemprop='assigneeOriginal')]
+        assignee_name_orig = [x.get_text() for x in soup.find_all('dd',itemprop='assigneeOriginal')]
+        # assignee_name_current = [{'assignee_name':x.get_text()} for x in soup.find_all('dd',itemprop='assigneeCurrent')]
+        assignee_name_current = [x.get_text().strip() for x in soup.find_all('dd',itemprop='assigneeCurrent')]
           
         # Publication Date #
-        try:
-            publication_date = soup.find('dd',itemprop='publicationDate').get_text()
-        except:
-            publication_date = ''
+        publication_date = _txt(soup,'dd',itemprop='publicationDate')
         # Application Number #
-        try: 
-            application_number = soup.find('dd',itemprop="applicationNumber").get_text()
-        except:
-            application_number = ''
+        application_number = _txt(soup,'dd',itemprop="applicationNumber")
         # Publication Number #
-        try:
-            publication_number = soup.find('dd',itemprop="publicationNumber").get_text()
-        except:
-            publication_number = ''
+        publication_number = _txt(soup,'dd',itemprop="publicationNumber")
 
         # Filing Date # 
-        try:
-            filing_date = soup.find('span',itemprop='filingDate').get_text()
-        except:
-            filing_date = ''
+        filing_date = _txt(soup,'span',itemprop='filingDate')
 
         # Leal Status #
-        try:
-            legal_status_ifi = soup.find('dd',itemprop='legalStatusIfi').get_text().strip()
-        except:
-            legal_status_ifi = ''
+        legal_status_ifi = _txt(soup,'dd',itemprop='legalStatusIfi',strip=True)
 
         # Loop through all events #
         list_of_application_events = soup.find_all('dd',itemprop='events')
@@ -242,20 +228,18 @@ class scraper_class:
         expiration_date = ''
         for app_event in list_of_application_events:
             # Get information #
-            try:
-                title_info = app_event.find('span',itemprop='type').get_text()
-                timeevent = app_event.find('time',itemprop='date').get_text()
-                if title_info == 'priority':
-                    priority_date = timeevent
-                if title_info == 'granted':
-                    granted_date = timeevent
-                if title_info == 'publication' and publication_date=='':
-                    publication_date = timeevent
-                if 'expiration' in app_event.find('span',itemprop='title').get_text().lower():
-                    expiration_date = timeevent
-
-            except:
-                continue 
+            title_info = _txt(app_event,'span',itemprop='type')
+            timeevent = _txt(app_event,'time',itemprop='date')
+            if not title_info or not timeevent:
+                continue
+            if title_info == 'priority':
+                priority_date = timeevent
+            if title_info == 'granted':
+                granted_date = timeevent
+            if title_info == 'publication' and publication_date=='':
+                publication_date = timeevent
+            if 'expiration' in _txt(app_event,'span',itemprop='title').lower():
+                expiration_date = timeevent
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
         #             Citations
@@ -322,8 +306,7 @@ class scraper_class:
             # # Get text 
             # if abstract:
             #     abstract_text=abstract['content']
-            selector = ".abstract"
-            element = soup.select_one(selector)
+            element = _ABSTRACT_SEL.select_one(soup)
             if element:
                 abstract_text = element.text.strip()
             else:
@@ -360,9 +343,9 @@ class scraper_class:
         #  Return data as a dictionary
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
         return({'title': title_text,
-                'inventor_name': json.dumps(inventor_name, ensure_ascii=False),
-                'assignee_name_orig': json.dumps(assignee_name_orig, ensure_ascii=False),
-                'assignee_name_current': json.dumps(assignee_name_current, ensure_ascii=False),
+                'inventor_name': orjson.dumps(inventor_name).decode('utf-8'),
+                'assignee_name_orig': orjson.dumps(assignee_name_orig).decode('utf-8'),
+                'assignee_name_current': orjson.dumps(assignee_name_current).decode('utf-8'),
                 'publication_date': publication_date,
                 'priority_date': priority_date,
                 'granted_date': granted_date,
@@ -371,11 +354,11 @@ class scraper_class:
                 'application_number': application_number,
                 'publication_number': publication_number,
                 'expiration_date': expiration_date,
-                'forward_cite_no_family': json.dumps(forward_cites_no_family),
-                'forward_cite_yes_family': json.dumps(forward_cites_yes_family),
-                'backward_cite_no_family': json.dumps(backward_cites_no_family),
-                'backward_cite_yes_family': json.dumps(backward_cites_yes_family),
-                'classifications': json.dumps(classifications),
+                'forward_cite_no_family': orjson.dumps(forward_cites_no_family).decode('utf-8'),
+                'forward_cite_yes_family': orjson.dumps(forward_cites_yes_family).decode('utf-8'),
+                'backward_cite_no_family': orjson.dumps(backward_cites_no_family).decode('utf-8'),
+                'backward_cite_yes_family': orjson.dumps(backward_cites_yes_family).decode('utf-8'),
+                'classifications': orjson.dumps(classifications).decode('utf-8'),
                 'abstract_text': abstract_text,
                 'description_text': description_text,
                 'claims_text': claims_text})
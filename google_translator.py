@@ -1,14 +1,83 @@
 # First, you need to install the requests library
-# You can do this by running: pip install requests
+# You can do this by running: pip install requests brotli "httpx[http2]"
+# (with brotli installed, requests also accepts and decodes "br" compressed responses)
 
+import asyncio
+import logging
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 # import json
 import urllib.parse
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+# Shared session so repeated translations reuse pooled TCP/TLS connections
+# instead of doing a fresh handshake for every call.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Set a User-Agent header to mimic a browser
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Retries (with exponential backoff) for a request rate-limited with HTTP 429.
+_MAX_RETRIES = 4
+
+# Translations shared by translate_text and translate_many_async, least recently used first.
+_CACHE_SIZE = 10000
+_TRANSLATION_CACHE = OrderedDict()
+
+# The endpoint rejects overly long URLs, so batches are cut at roughly this many encoded characters.
+_MAX_BATCH_CHARS = 5000
+
+def _build_url(text: str, target_language: str, source_language: str) -> str:
+    """Builds the gtx endpoint URL for a single text."""
+    encoded_text = urllib.parse.quote(text)
+    return f"https://translate.googleapis.com/translate_a/single?client=gtx&sl={source_language}&tl={target_language}&dt=t&q={encoded_text}"
+
+def _join_segments(result_json) -> str:
+    """Joins the translated segments of a gtx response into one string."""
+    # The translated text is contained within a nested list structure.
+    # We iterate through the segments and join them.
+    return "".join(segment[0] for segment in result_json[0] if segment[0])
+
+def _parse_translation(content: bytes) -> str:
+    """Parses a gtx response body, raising the module's parse error if its format is unexpected."""
+    try:
+        return _join_segments(orjson.loads(content))
+    except (IndexError, KeyError, TypeError, ValueError):
+        error_message = "Failed to parse the translation from the API response. The response format may have changed."
+        log.warning(error_message)
+        raise Exception(error_message) from None
+
+def _cache_get(key):
+    """Returns a cached translation for (text, target_language, source_language), or None."""
+    translation = _TRANSLATION_CACHE.get(key)
+    if translation is not None:
+        _TRANSLATION_CACHE.move_to_end(key)
+    return translation
+
+def _cache_put(key, translation: str) -> None:
+    """Caches a translation, evicting the least recently used one beyond _CACHE_SIZE."""
+    _TRANSLATION_CACHE[key] = translation
+    _TRANSLATION_CACHE.move_to_end(key)
+    if len(_TRANSLATION_CACHE) > _CACHE_SIZE:
+        _TRANSLATION_CACHE.popitem(last=False)
 
 def translate_text(text: str, target_language: str, source_language: str) -> str:
     """
     Translates text using an unofficial Google Translate API endpoint.
 
+    Results are cached per (text, target_language, source_language), so repeated
+    sentences (e.g. boilerplate shared across patent claims) are only sent once.
+    Failed translations raise and are not cached.
+
     This method is based on the one used by many open-source projects.
     DISCLAIMER: This is not an officially supported Google API. It may break
     or be rate-limited without warning. For production applications, using the
@@ -26,42 +95,173 @@ def translate_text(text: str, target_language: str, source_language: str) -> str
         requests.exceptions.RequestException: If there is a network-related error.
         Exception: If the response format is unexpected.
     """
-    # URL encode the text to be translated
-    encoded_text = urllib.parse.quote(text)
-    
-    # Construct the URL for the unofficial API endpoint
-    url = f"https://translate.googleapis.com/translate_a/single?client=gtx&sl={source_language}&tl={target_language}&dt=t&q={encoded_text}"
-    
-    # Set a User-Agent header to mimic a browser
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    key = (text, target_language, source_language)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    # Construct the URL (with the URL encoded text) for the unofficial API endpoint
+    url = _build_url(text, target_language, source_language)
     
     try:
         # Make the GET request
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=_HEADERS, timeout=10)
         response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
         
-        # The response is a JSON array, parse it
-        result_json = response.json()
-        
-        # The translated text is contained within a nested list structure.
-        # We iterate through the segments and join them.
-        translated_segments = [segment[0] for segment in result_json[0] if segment[0]]
-        translated_text = "".join(translated_segments)
-        
-        print(f"Original Text: '{text}'")
-        print(f"Translated Text: '{translated_text}'")
-        
-        return translated_text
-
     except requests.exceptions.RequestException as e:
-        print(f"A network error occurred: {e}")
+        log.warning("A network error occurred: %s", e)
         raise
-    except (IndexError, TypeError):
-        error_message = "Failed to parse the translation from the API response. The response format may have changed."
-        print(error_message)
-        raise Exception(error_message) from None
+
+    # The response is a JSON array, parse it
+    translated_text = _parse_translation(response.content)
+
+    log.debug("Original Text: '%s'", text)
+    log.debug("Translated Text: '%s'", translated_text)
+
+    _cache_put(key, translated_text)
+    return translated_text
+
+
+async def _translate_one_async(client, semaphore, text: str, target_language: str, source_language: str) -> str:
+    """Translates one text on the shared async client, backing off while rate-limited."""
+    url = _build_url(text, target_language, source_language)
+    async with semaphore:
+        for attempt in range(_MAX_RETRIES + 1):
+            response = await client.get(url)
+            if response.status_code != 429 or attempt == _MAX_RETRIES:
+                break
+            await asyncio.sleep(2 ** attempt)
+    response.raise_for_status()
+    return _parse_translation(response.content)
+
+
+async def translate_many_async(texts: list, target_language: str, source_language: str, concurrency: int = 20) -> list:
+    """
+    Translates many texts concurrently over a single HTTP/2 connection pool.
+
+    Requests are multiplexed over a few connections, so throughput is bounded by the
+    server's rate limit rather than by round-trip time. Responses with HTTP 429 are
+    retried with exponential backoff. Translations share translate_text's cache, and
+    each distinct text is requested only once.
+
+    Args:
+        texts (list): The texts to be translated.
+        target_language (str): The language code for the target language (e.g., 'en', 'es').
+        source_language (str): The language code for the source language (e.g., 'zh-CN', 'fr').
+        concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 20.
+
+    Returns:
+        list: The translated texts, in the same order as the input.
+
+    Raises:
+        httpx.HTTPError: If a request fails or is still rate-limited after retries.
+        Exception: If a response format is unexpected.
+    """
+    translations = {}
+    for text in texts:
+        cached = _cache_get((text, target_language, source_language))
+        if cached is not None:
+            translations[text] = cached
+    missing = [text for text in dict.fromkeys(texts) if text not in translations]
+
+    if missing:
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(http2=True, limits=limits, headers=_HEADERS, timeout=10) as client:
+            results = await asyncio.gather(
+                *(_translate_one_async(client, semaphore, text, target_language, source_language) for text in missing)
+            )
+        for text, translated_text in zip(missing, results):
+            _cache_put((text, target_language, source_language), translated_text)
+            translations[text] = translated_text
+
+    return [translations[text] for text in texts]
+
+
+def translate_many(texts: list, target_language: str, source_language: str, concurrency: int = 20) -> list:
+    """
+    Synchronous wrapper around translate_many_async.
+
+    Must not be called from inside a running event loop; await translate_many_async there instead.
+
+    Args:
+        texts (list): The texts to be translated.
+        target_language (str): The language code for the target language (e.g., 'en', 'es').
+        source_language (str): The language code for the source language (e.g., 'zh-CN', 'fr').
+        concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 20.
+
+    Returns:
+        list: The translated texts, in the same order as the input.
+    """
+    return asyncio.run(translate_many_async(texts, target_language, source_language, concurrency))
+
+
+def _first_string(item):
+    """Unwraps a batch result entry, which is either the translation or [translation, detected_language]."""
+    while isinstance(item, list) and item:
+        item = item[0]
+    return item
+
+
+def _chunk_encoded_texts(encoded_texts: list) -> list:
+    """Groups URL-encoded texts so each request stays under _MAX_BATCH_CHARS."""
+    chunks, current, current_len = [], [], 0
+    for encoded_text in encoded_texts:
+        encoded_len = len(encoded_text) + len("&q=")
+        if current and current_len + encoded_len > _MAX_BATCH_CHARS:
+            chunks.append(current)
+            current, current_len = [], 0
+        current.append(encoded_text)
+        current_len += encoded_len
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def translate_batch(texts: list, target_language: str, source_language: str) -> list:
+    """
+    Translates many texts with one request per batch by repeating the `q=` parameter.
+
+    Texts are grouped into batches of about _MAX_BATCH_CHARS encoded characters.
+    If the endpoint rejects a batch (HTTP 400) or returns a result that does not
+    line up with the inputs, that batch falls back to one translate_text call per text.
+
+    Args:
+        texts (list): The texts to be translated.
+        target_language (str): The language code for the target language (e.g., 'en', 'es').
+        source_language (str): The language code for the source language (e.g., 'zh-CN', 'fr').
+
+    Returns:
+        list: The translated texts, in the same order as the input.
+
+    Raises:
+        requests.exceptions.RequestException: If there is a network-related error.
+    """
+    translations = []
+    start = 0
+    for chunk in _chunk_encoded_texts([urllib.parse.quote(text) for text in texts]):
+        chunk_texts = texts[start:start + len(chunk)]
+        start += len(chunk)
+
+        query = "&".join(f"q={encoded_text}" for encoded_text in chunk)
+        url = f"https://translate.googleapis.com/translate_a/t?client=gtx&sl={source_language}&tl={target_language}&{query}"
+        response = _SESSION.get(url, headers=_HEADERS, timeout=10)
+        if response.status_code != 400:
+            response.raise_for_status()
+            try:
+                result_json = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                result_json = None
+            # A single q= comes back unwrapped, several as a list aligned with the inputs.
+            items = [result_json] if len(chunk) == 1 else result_json
+            if isinstance(items, list) and len(items) == len(chunk):
+                chunk_translations = [_first_string(item) for item in items]
+                if all(isinstance(t, str) for t in chunk_translations):
+                    translations.extend(chunk_translations)
+                    continue
+
+        translations.extend(translate_text(text, target_language, source_language) for text in chunk_texts)
+    return translations
 
 
 # --- Example Usage ---
@@ -73,7 +273,7 @@ if __name__ == "__main__":
     target_lang_en = "en"
     source_lang_cn = "zh-CN"
     try:
-        translate_text(source_text_cn, target_lang_en, source_lang_cn)
+        print(f"Translated Text: '{translate_text(source_text_cn, target_lang_en, source_lang_cn)}'")
     except Exception:
         print("Translation failed for Example 1.")
 
@@ -85,7 +285,7 @@ if __name__ == "__main__":
     target_lang_es = "es"
     source_lang_en = "en"
     try:
-        translate_text(source_text_en, target_lang_es, source_lang_en)
+        print(f"Translated Text: '{translate_text(source_text_en, target_lang_es, source_lang_en)}'")
     except Exception:
         print("Translation failed for Example 2.")
 
@@ -97,6 +297,6 @@ if __name__ == "__main__":
     target_lang_de = "de"
     source_lang_fr = "fr"
     try:
-        translate_text(source_text_fr, target_lang_de, source_lang_fr)
+        print(f"Translated Text: '{translate_text(source_text_fr, target_lang_de, source_lang_fr)}'")
     except Exception:
         print("Translation failed for Example 3.")
@@ -1,8 +1,22 @@
 # main.py
 import asyncio
+import gzip
+import hashlib
 import json
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+import logging
+import os
+import random
+import re
+import tempfile
+import time
+import zlib
+import lxml.html
+import orjson
+import requests
+from lxml import etree
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+log = logging.getLogger(__name__)
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 #                 Custom Errors
@@ -16,6 +30,128 @@ class NoPatentsError(Exception):
     """Custom exception for when no patents are provided to scrape."""
     pass
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+#             Compiled XPath Selectors
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+_XP_TITLE = etree.XPath('//meta[@name="DC.title"]/@content')
+_XP_ITEMPROP = etree.XPath('//*[@itemprop]')
+
+_XP_EVENT_TYPE = etree.XPath('.//span[@itemprop="type"]')
+_XP_EVENT_DATE = etree.XPath('.//time[@itemprop="date"]')
+_XP_EVENT_TITLE = etree.XPath('.//span[@itemprop="title"]')
+
+_XP_CITE_NUMBER = etree.XPath('.//span[@itemprop="publicationNumber"]')
+_XP_CITE_PRIORITY = etree.XPath('.//td[@itemprop="priorityDate"]')
+_XP_CITE_PUBLICATION = etree.XPath('.//td[@itemprop="publicationDate"]')
+
+_XP_CLASS_LEAF = etree.XPath('.//meta[@itemprop="Leaf"][@content="true"]')
+_XP_CLASS_CODE = etree.XPath('.//span[@itemprop="Code"]')
+_XP_CLASS_DESCRIPTION = etree.XPath('.//span[@itemprop="Description"]')
+
+_XP_ABSTRACT = etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " abstract ")]')
+_XP_DESCRIPTION = etree.XPath('//section[@itemprop="description"]')
+_XP_CLAIMS = etree.XPath('//section[@itemprop="claims"]')
+
+# (tag, itemprop) of every top-level element process_patent_html reads, mapped to its bucket.
+_ITEMPROP_BUCKETS = {
+    ('dd', 'inventor'): 'inventor',
+    ('dd', 'assigneeOriginal'): 'assignee_orig',
+    ('dd', 'assigneeCurrent'): 'assignee_current',
+    ('dd', 'publicationDate'): 'publication_date',
+    ('dd', 'applicationNumber'): 'application_number',
+    ('span', 'filingDate'): 'filing_date',
+    ('dd', 'legalStatusIfi'): 'legal_status',
+    ('dd', 'events'): 'events',
+    ('tr', 'forwardReferencesOrig'): 'forward_cites_orig',
+    ('tr', 'forwardReferencesFamily'): 'forward_cites_family',
+    ('tr', 'backwardReferences'): 'backward_cites_orig',
+    ('tr', 'backwardReferencesFamily'): 'backward_cites_family',
+    ('li', 'classifications'): 'classifications',
+    ('section', 'description'): 'description',
+    ('section', 'claims'): 'claims',
+}
+
+
+def _text(element, separator=''):
+    """Joins the stripped, non-empty text nodes of an element (mirrors bs4's get_text(strip=True))."""
+    return separator.join(t.strip() for t in element.itertext() if t.strip())
+
+
+def _collect_itemprops(tree):
+    """
+    Sorts every itemprop element of a page into buckets in a single document pass.
+
+    Returns:
+        dict: Maps each bucket name in _ITEMPROP_BUCKETS to its elements, in document order.
+    """
+    buckets = {name: [] for name in _ITEMPROP_BUCKETS.values()}
+    for element in _XP_ITEMPROP(tree):
+        name = _ITEMPROP_BUCKETS.get((element.tag, element.get('itemprop')))
+        if name is not None:
+            buckets[name].append(element)
+    return buckets
+
+
+def _first_text(elements):
+    """Returns the text of the first element in an XPath result, or '' if there is none."""
+    return _text(elements[0]) if elements else ''
+
+
+# Fields of a parsed patent that hold lists rather than plain strings.
+_LIST_FIELDS = (
+    'inventor_name', 'assignee_name_orig', 'assignee_name_current',
+    'forward_cite_no_family', 'forward_cite_yes_family',
+    'backward_cite_no_family', 'backward_cite_yes_family',
+    'classifications',
+)
+
+
+def to_json(parsed):
+    """
+    Serializes the list fields of a parsed patent to JSON strings.
+
+    Parsing keeps these fields as Python lists; call this only where string values
+    are required, e.g. when writing rows to a CSV file or database.
+
+    Args:
+        parsed (dict): A parsed patent as returned by get_scraped_data.
+
+    Returns:
+        dict: A copy of the patent with every list field encoded as a JSON string.
+    """
+    serialized = dict(parsed)
+    for field in _LIST_FIELDS:
+        if field in serialized:
+            serialized[field] = orjson.dumps(serialized[field]).decode('utf-8')
+    return serialized
+
+
+# User agents rotated across plain HTTP requests.
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0',
+)
+
+# Requests that do not affect the extracted fields are aborted in the browser.
+_BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+_BLOCKED_URL_PARTS = ('google-analytics', 'googletagmanager')
+
+
+async def _block_unneeded_requests(route):
+    """Playwright route handler that aborts images, fonts, media, stylesheets and analytics."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(part in request.url for part in _BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Cached pages are refreshed after this many seconds so legal status updates are picked up.
+DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 #             Create scraper class
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
@@ -24,19 +160,20 @@ class scraper_class:
     Google scraper class using Playwright to scrape data from 'https://patents.google.com/'.
 
     This version uses Playwright to launch a browser, ensuring that dynamically loaded
-    content (via JavaScript) is captured.
+    content (via JavaScript) is captured. A single browser is launched per scraper and
+    a fixed pool of browser contexts is reused across patents.
 
     There are two primary ways to use the class:
 
         (1) Add a list of patents and scrape them all at once.
 
-            with scraper_class() as scraper: #<- Use as a context manager
+            async with scraper_class() as scraper: #<- Use as an async context manager
                 # ~ Add patents to list ~ #
                 scraper.add_patents('US2668287A')
                 scraper.add_patents('US8834455B2') # Another example
 
                 # ~ Scrape all patents ~ #
-                scraper.scrape_all_patents()
+                await scraper.scrape_all_patents()
 
                 # ~ Get results of scrape ~ #
                 patent_1_parsed = scraper.parsed_patents['US2668287A']
@@ -46,12 +183,12 @@ class scraper_class:
 
         (2) Scrape each patent individually.
 
-            with scraper_class() as scraper: #<- Use as a context manager
+            async with scraper_class() as scraper: #<- Use as an async context manager
                 # ~~ Scrape patents individually ~~ #
                 patent_1 = 'US2668287A'
-                err_1, soup_1, url_1 = scraper.request_single_patent(patent_1)
+                err_1, tree_1, url_1 = await scraper.request_single_patent(patent_1)
                 if err_1 == 'Success':
-                    patent_1_parsed = scraper.get_scraped_data(soup_1, patent_1, url_1)
+                    patent_1_parsed = scraper.get_scraped_data(tree_1, patent_1, url_1)
                     print(json.dumps(patent_1_parsed, indent=2))
 
 
@@ -62,41 +199,63 @@ class scraper_class:
         return_abstract (bool): If True, the abstract will be included in the output.
         return_description (bool): If True, the description will be included.
         return_claims (bool): If True, the claims will be included.
-        playwright (SyncPlaywright): The Playwright instance.
+        playwright (Playwright): The Playwright instance.
         browser (Browser): The Playwright browser instance.
+        concurrency (int): Number of pooled browser contexts, i.e. patents fetched at once.
+        cache_dir (str): Directory for the on-disk page cache. Caching is disabled when None.
+        cache_ttl (int): Age in seconds after which a cached page is fetched again.
+        compress_results (bool): If True, parsed_patents holds zlib-compressed JSON bytes
+            instead of dicts; read entries back with get_parsed().
     """
-    def __init__(self, return_abstract=False, return_description=False, return_claims=False, headless=True):
-        """Initializes the scraper, starts Playwright, and launches a browser."""
+    def __init__(self, return_abstract=False, return_description=False, return_claims=False, headless=True,
+                 cache_dir=None, cache_ttl=DEFAULT_CACHE_TTL, concurrency=4, compress_results=False):
+        """Initializes the scraper's configuration. The browser is started in __aenter__."""
         self.list_of_patents = []
         self.scrape_status = {}
         self.parsed_patents = {}
         self.return_abstract = return_abstract
         self.return_description = return_description
         self.return_claims = return_claims
-        
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.headless = headless
+        self.concurrency = concurrency
+        self.compress_results = compress_results
+        self.playwright = None
+        self.browser = None
+        self._contexts = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        """Enter context manager, starting Playwright and pre-warming the context pool."""
         # --- Playwright Initialization ---
         try:
-            self.playwright = sync_playwright().start()
-            self.browser = self.playwright.chromium.launch(headless=headless)
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._contexts = asyncio.Queue()
+            for _ in range(self.concurrency):
+                self._contexts.put_nowait(await self._new_context())
         except Exception as e:
             print(f"Failed to initialize Playwright: {e}")
+            await self.close()
             raise
-
-    def __enter__(self):
-        """Enter context manager."""
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager, ensuring resources are closed."""
-        self.close()
+        await self.close()
 
-    def close(self):
-        """Closes the Playwright browser and stops the Playwright instance."""
+    async def close(self):
+        """Closes the pooled contexts and browser and stops the Playwright instance."""
         print("Closing browser and Playwright resources...")
-        if hasattr(self, 'browser') and self.browser:
-            self.browser.close()
-        if hasattr(self, 'playwright') and self.playwright:
-            self.playwright.stop()
+        if self._contexts:
+            while not self._contexts.empty():
+                await self._contexts.get_nowait().close()
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
         print("Resources closed.")
 
     def add_patents(self, patent):
@@ -126,9 +285,153 @@ class scraper_class:
         """Add the status of a scrape to the scrape_status dictionary."""
         self.scrape_status[patent] = success_value
 
+    def _cache_path(self, kind, key):
+        """Returns the path of a cache entry, making the key safe to use as a file name."""
+        safe_key = re.sub(r'[^\w.-]', '_', key)
+        return os.path.join(self.cache_dir, kind, f'{safe_key}.json.gz')
+
+    def _read_cache(self, kind, key):
+        """Returns the cached payload for a key, or None on a miss or an expired entry."""
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(kind, key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with gzip.open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, kind, key, payload):
+        """Writes a payload to the cache atomically so readers never see a partial file."""
+        if not self.cache_dir:
+            return
+        path = self._cache_path(kind, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wb') as f:
+                f.write(orjson.dumps(payload))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning('Could not write cache entry %s: %s', path, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _parsed_cache_key(self, html_content):
+        """Returns the cache key for a parsed result (the page digest plus the output flags), or None without a cache_dir."""
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+        flags = ''.join('1' if flag else '0' for flag in (self.return_abstract, self.return_description, self.return_claims))
+        return f'{digest}-{flags}'
+
+    async def _new_context(self):
+        """Creates a browser context that skips resources the parser never reads."""
+        context = await self.browser.new_context()
+        await context.route("**/*", _block_unneeded_requests)
+        return context
+
+    async def _recycle_context(self, context):
+        """Replaces a context that hit an error with a fresh one, keeping the browser alive."""
+        try:
+            await context.close()
+        except Exception as e:
+            log.warning('Failed to close browser context: %s', e)
+        return await self._new_context()
+
+    async def _fast_fetch(self, patent):
+        """
+        Fetches the server-rendered patent page with a plain HTTP GET.
+
+        Google Patents serves every field we extract in its initial HTML, so the browser is
+        only needed when this fails: on a network error, a non-200 response (e.g. a 403/429
+        bot block or a number that needs the search redirect), or an empty page or one without content.
+
+        Returns:
+            tuple or None: (final_url, html_content, tree), or None if the browser should be used.
+        """
+        url = f"https://patents.google.com/patent/{patent}/en"
+        headers = {'User-Agent': random.choice(_USER_AGENTS)}
+        try:
+            response = await asyncio.to_thread(requests.get, url, headers=headers, timeout=20)
+        except requests.exceptions.RequestException as e:
+            log.debug('Patent: %s, fast fetch failed (%s), falling back to browser', patent, e)
+            return None
+        if response.status_code != 200:
+            log.debug('Patent: %s, fast fetch returned %s, falling back to browser', patent, response.status_code)
+            return None
+
+        html_content = response.text
+        if not html_content.strip():
+            return None
+        try:
+            tree = lxml.html.fromstring(html_content)
+        except etree.ParserError:
+            # e.g. a comment-only body, which lxml treats as an empty document.
+            return None
+        if not _XP_TITLE(tree) or not (_XP_ABSTRACT(tree) or _XP_DESCRIPTION(tree) or _XP_CLAIMS(tree)):
+            return None
+        return response.url, html_content, tree
+
+    async def _fetch_page(self, patent):
+        """
+        Fetches a single patent page, from the cache, over plain HTTP or in the browser.
+
+        Returns:
+            tuple: (status, html_content, tree, url). tree is the page already parsed by the
+                   fast fetch, or None if the HTML has not been parsed yet.
+        """
+        cached = self._read_cache('html', patent)
+        if cached is not None:
+            log.debug("Cache hit for: %s", patent)
+            return 'Success', cached['html'], None, cached['url']
+
+        fetched = await self._fast_fetch(patent)
+        if fetched is not None:
+            final_url, html_content, tree = fetched
+            self._write_cache('html', patent, {'url': final_url, 'html': html_content})
+            return 'Success', html_content, tree, final_url
+
+        initial_url = f"https://patents.google.com/?oq={patent}"
+        async with self._semaphore:
+            context = await self._contexts.get()
+            try:
+                page = await context.new_page()
+                await page.goto(initial_url, wait_until='domcontentloaded', timeout=60000)
+                # Gate on the data we actually extract instead of waiting for the network to go idle.
+                await page.wait_for_selector('[itemprop="publicationDate"]', state='attached', timeout=15000)
+
+                # After waiting, the page URL will have updated to the final redirected URL.
+                final_url = page.url
+                log.debug("Redirected to: %s", final_url)
+                html_content = await page.content()
+                self._write_cache('html', patent, {'url': final_url, 'html': html_content})
+
+                await page.close()
+                return 'Success', html_content, None, final_url
+            except PlaywrightTimeoutError:
+                error_msg = f'Timeout Error: The page at {initial_url} took too long to load.'
+                log.warning('Patent: %s, %s', patent, error_msg)
+                context = await self._recycle_context(context)
+                return error_msg, '', None, initial_url
+            except Exception as e:
+                error_msg = f'An unexpected error occurred: {e}'
+                log.warning('Patent: %s, %s', patent, error_msg)
+                context = await self._recycle_context(context)
+                return error_msg, '', None, initial_url
+            finally:
+                self._contexts.put_nowait(context)
+
     async def request_single_patent(self, patent):
         """
-        Fetches a single patent page using Playwright and returns the parsed HTML.
+        Fetches a single patent page and returns the parsed HTML.
+
+        A plain HTTP request is tried first; Playwright is only used when that does not
+        return a usable page. At most `concurrency` browser fetches run at once, each
+        borrowing a context from the pool. When a cache_dir is set, pages fetched within
+        cache_ttl are read from disk instead of being downloaded again.
 
         Args:
             patent (str): The patent number (e.g., 'US2668287A').
@@ -136,168 +439,124 @@ class scraper_class:
         Returns:
             tuple: A tuple containing:
                 - str: The status of the scrape ('Success' or an error message).
-                - BeautifulSoup object or str: The parsed HTML soup, or an empty string on failure.
+                - lxml.html.HtmlElement or str: The parsed HTML tree, or an empty string on failure.
                 - str: The final URL visited.
         """
-        
-        p = self.playwright
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
-        try:
-            initial_url = f"https://patents.google.com/?oq={patent}"
-            await page.goto(initial_url, wait_until='networkidle', timeout=60000)
-
-            # After waiting, the page URL will have updated to the final redirected URL.
-            final_url = page.url
-            print(f"➡️ Redirected to: {final_url}")
-            html_content = await page.content()
-
-            soup = BeautifulSoup(html_content, "lxml")
-            page.close()
-            return 'Success', soup, final_url
-        except PlaywrightTimeoutError:
-            error_msg = f'Timeout Error: The page at {url} took too long to load.'
-            print(f'Patent: {patent}, {error_msg}')
-            if page:
-                page.close()
-            return error_msg, '', url
-        except Exception as e:
-            error_msg = f'An unexpected error occurred: {e}'
-            print(f'Patent: {patent}, {error_msg}')
-            if page:
-                page.close()
-            return error_msg, '', url
+        status, html_content, tree, url = await self._fetch_page(patent)
+        if status != 'Success':
+            return status, '', url
+        if tree is None:
+            try:
+                tree = lxml.html.fromstring(html_content)
+            except etree.ParserError as e:
+                error_msg = f'An unexpected error occurred: {e}'
+                log.warning('Patent: %s, %s', patent, error_msg)
+                return error_msg, '', url
+        return status, tree, url
 
     def parse_citation(self, single_citation):
         """
         Parses a single patent citation from a table row element.
 
         Args:
-            single_citation (bs4.element.Tag): The BeautifulSoup tag for a citation row.
+            single_citation (lxml.html.HtmlElement): The ``<tr>`` element for a citation row.
 
         Returns:
             dict: A dictionary with 'patent_number', 'priority_date', and 'publication_date'.
         """
-        try:
-            patent_number = single_citation.find('span', itemprop='publicationNumber').get_text(strip=True)
-        except AttributeError:
-            patent_number = ''
-        
-        try:
-            priority_date = single_citation.find('td', itemprop='priorityDate').get_text(strip=True)
-        except AttributeError:
-            priority_date = ''
-            
-        try:
-            publication_date = single_citation.find('td', itemprop='publicationDate').get_text(strip=True)
-        except AttributeError:
-            publication_date = ''
-            
         return {
-            'patent_number': patent_number,
-            'priority_date': priority_date,
-            'publication_date': publication_date
+            'patent_number': _first_text(_XP_CITE_NUMBER(single_citation)),
+            'priority_date': _first_text(_XP_CITE_PRIORITY(single_citation)),
+            'publication_date': _first_text(_XP_CITE_PUBLICATION(single_citation))
         }
 
-    def process_patent_html(self, soup):
+    def process_patent_html(self, tree):
         """
         Parses the full HTML of a patent page to extract key information.
 
         Args:
-            soup (bs4.BeautifulSoup): The BeautifulSoup object for the patent page.
+            tree (lxml.html.HtmlElement): The parsed lxml tree for the patent page.
 
         Returns:
-            dict: A dictionary containing all extracted patent data.
+            dict: A dictionary containing all extracted patent data. Inventors, assignees,
+                citations and classifications are plain lists; use to_json() to get the
+                JSON-string form.
         """
         # --- Title ---
-        try:
-            title_text = soup.find('meta', attrs={'name': 'DC.title'})['content'].rstrip()
-        except (TypeError, KeyError):
-            title_text = ''
+        title = _XP_TITLE(tree)
+        title_text = title[0].rstrip() if title else ''
+
+        # One pass over the itemprop elements fills every bucket used below.
+        found = _collect_itemprops(tree)
 
         # --- Inventors & Assignees ---
-        inventor_name = [x.get_text(strip=True) for x in soup.find_all('dd', itemprop='inventor')]
-        assignee_name_orig = [x.get_text(strip=True) for x in soup.find_all('dd', itemprop='assigneeOriginal')]
-        assignee_name_current = [x.get_text(strip=True) for x in soup.find_all('dd', itemprop='assigneeCurrent')]
+        inventor_name = [_text(x) for x in found['inventor']]
+        assignee_name_orig = [_text(x) for x in found['assignee_orig']]
+        assignee_name_current = [_text(x) for x in found['assignee_current']]
 
         # --- Core Dates & Numbers ---
-        try:
-            publication_date = soup.find('dd', itemprop='publicationDate').get_text(strip=True)
-        except AttributeError:
-            publication_date = ''
-        
-        try:
-            application_number = soup.find('dd', itemprop="applicationNumber").get_text(strip=True)
-        except AttributeError:
-            application_number = ''
-            
-        try:
-            filing_date = soup.find('span', itemprop='filingDate').get_text(strip=True)
-        except AttributeError:
-            filing_date = ''
+        publication_date = _first_text(found['publication_date'])
+        application_number = _first_text(found['application_number'])
+        filing_date = _first_text(found['filing_date'])
 
         # --- Legal Status ---
-        try:
-            legal_status_ifi = soup.find('dd', itemprop='legalStatusIfi').get_text(strip=True)
-        except AttributeError:
-            legal_status_ifi = ''
+        legal_status_ifi = _first_text(found['legal_status'])
 
         # --- Event Dates (Priority, Granted, Expiration) ---
         priority_date, granted_date, expiration_date = '', '', ''
-        for event in soup.find_all('dd', itemprop='events'):
-            try:
-                event_type = event.find('span', itemprop='type').get_text(strip=True)
-                event_date = event.find('time', itemprop='date').get_text(strip=True)
-                if event_type == 'priority':
-                    priority_date = event_date
-                elif event_type == 'granted':
-                    granted_date = event_date
-                elif event_type == 'publication' and not publication_date:
-                    publication_date = event_date
-                
-                event_title_span = event.find('span', itemprop='title')
-                if event_title_span and 'expiration' in event_title_span.get_text(strip=True).lower():
-                    expiration_date = event_date
-            except AttributeError:
+        for event in found['events']:
+            event_type = _XP_EVENT_TYPE(event)
+            event_date = _XP_EVENT_DATE(event)
+            if not event_type or not event_date:
                 continue
+            event_type = _text(event_type[0])
+            event_date = _text(event_date[0])
+            if event_type == 'priority':
+                priority_date = event_date
+            elif event_type == 'granted':
+                granted_date = event_date
+            elif event_type == 'publication' and not publication_date:
+                publication_date = event_date
+
+            event_title_span = _XP_EVENT_TITLE(event)
+            if event_title_span and 'expiration' in _text(event_title_span[0]).lower():
+                expiration_date = event_date
 
         # --- Citations ---
-        forward_cites_no_family = [self.parse_citation(c) for c in soup.find_all('tr', itemprop="forwardReferencesOrig")]
-        forward_cites_yes_family = [self.parse_citation(c) for c in soup.find_all('tr', itemprop="forwardReferencesFamily")]
-        backward_cites_no_family = [self.parse_citation(c) for c in soup.find_all('tr', itemprop='backwardReferences')]
-        backward_cites_yes_family = [self.parse_citation(c) for c in soup.find_all('tr', itemprop='backwardReferencesFamily')]
+        forward_cites_no_family = [self.parse_citation(c) for c in found['forward_cites_orig']]
+        forward_cites_yes_family = [self.parse_citation(c) for c in found['forward_cites_family']]
+        backward_cites_no_family = [self.parse_citation(c) for c in found['backward_cites_orig']]
+        backward_cites_yes_family = [self.parse_citation(c) for c in found['backward_cites_family']]
 
         # --- Classifications ---
         classifications = []
-        for item in soup.find_all('li', itemprop='classifications'):
-            if item.find('meta', itemprop='Leaf', content='true'):
-                try:
-                    code = item.find('span', itemprop='Code').get_text(strip=True)
-                    description = item.find('span', itemprop='Description').get_text(strip=True)
-                    classifications.append({'code': code, 'description': description})
-                except AttributeError:
-                    continue
-        
+        for item in found['classifications']:
+            if _XP_CLASS_LEAF(item):
+                code = _XP_CLASS_CODE(item)
+                description = _XP_CLASS_DESCRIPTION(item)
+                if code and description:
+                    classifications.append({'code': _text(code[0]), 'description': _text(description[0])})
+
         # --- Abstract, Description, Claims (optional) ---
         abstract_text, description_text, claims_text = '', '', ''
         if self.return_abstract:
-            abstract_element = soup.select_one(".abstract")
-            abstract_text = abstract_element.text.strip() if abstract_element else "Abstract not found"
+            abstract_element = _XP_ABSTRACT(tree)
+            abstract_text = abstract_element[0].text_content().strip() if abstract_element else "Abstract not found"
 
         if self.return_description:
-            description_html = soup.find('section', itemprop='description')
-            description_text = description_html.get_text(separator='\n', strip=True) if description_html else ""
+            description_html = found['description']
+            description_text = _text(description_html[0], separator='\n') if description_html else ""
 
         if self.return_claims:
-            claims_html = soup.find('section', itemprop='claims')
-            claims_text = claims_html.get_text(separator='\n', strip=True) if claims_html else ""
+            claims_html = found['claims']
+            claims_text = _text(claims_html[0], separator='\n') if claims_html else ""
 
         # --- Return Data ---
         return {
             'title': title_text,
-            'inventor_name': json.dumps(inventor_name, ensure_ascii=False),
-            'assignee_name_orig': json.dumps(assignee_name_orig, ensure_ascii=False),
-            'assignee_name_current': json.dumps(assignee_name_current, ensure_ascii=False),
+            'inventor_name': inventor_name,
+            'assignee_name_orig': assignee_name_orig,
+            'assignee_name_current': assignee_name_current,
             'publication_date': publication_date,
             'priority_date': priority_date,
             'granted_date': granted_date,
@@ -305,41 +564,109 @@ class scraper_class:
             'expiration_date': expiration_date,
             'application_number': application_number,
             'legal_status': legal_status_ifi,
-            'forward_cite_no_family': json.dumps(forward_cites_no_family, ensure_ascii=False),
-            'forward_cite_yes_family': json.dumps(forward_cites_yes_family, ensure_ascii=False),
-            'backward_cite_no_family': json.dumps(backward_cites_no_family, ensure_ascii=False),
-            'backward_cite_yes_family': json.dumps(backward_cites_yes_family, ensure_ascii=False),
-            'classifications': json.dumps(classifications, ensure_ascii=False),
+            'forward_cite_no_family': forward_cites_no_family,
+            'forward_cite_yes_family': forward_cites_yes_family,
+            'backward_cite_no_family': backward_cites_no_family,
+            'backward_cite_yes_family': backward_cites_yes_family,
+            'classifications': classifications,
             'abstract_text': abstract_text,
             'description_text': description_text,
             'claims_text': claims_text
         }
 
-    def get_scraped_data(self, soup, patent, url):
-        """Processes the soup and adds metadata."""
-        parsed_data = self.process_patent_html(soup)
+    def get_scraped_data(self, tree, patent, url):
+        """Processes the parsed tree and adds metadata."""
+        parsed_data = self.process_patent_html(tree)
+        parsed_data['url'] = url
+        parsed_data['patent'] = patent
+        return parsed_data
+
+    def _parse_page(self, html_content, tree, patent, url):
+        """
+        Returns the parsed data for a page, reusing a cached result for the same HTML.
+
+        The page is only parsed into a tree (unless the fast fetch already did) on a miss.
+        """
+        cache_key = self._parsed_cache_key(html_content)
+        parsed_data = self._read_cache('parsed', cache_key) if cache_key else None
+        if parsed_data is None:
+            if tree is None:
+                tree = lxml.html.fromstring(html_content)
+            parsed_data = self.process_patent_html(tree)
+            if cache_key:
+                self._write_cache('parsed', cache_key, parsed_data)
         parsed_data['url'] = url
         parsed_data['patent'] = patent
         return parsed_data
 
-    def scrape_all_patents(self):
-        """Scrapes all patents in the list self.list_of_patents."""
+    def _store_parsed(self, patent, data):
+        """Stores a parsed result, compressing it when compress_results is set."""
+        if self.compress_results:
+            data = zlib.compress(orjson.dumps(data))
+        self.parsed_patents[patent] = data
+
+    def get_parsed(self, patent):
+        """
+        Returns the parsed data for a scraped patent, decompressing it if needed.
+
+        Args:
+            patent (str): The patent number.
+
+        Returns:
+            dict: The parsed patent data, or {'error': ...} if the scrape failed.
+        """
+        data = self.parsed_patents[patent]
+        if isinstance(data, bytes):
+            data = orjson.loads(zlib.decompress(data))
+        return data
+
+    async def _scrape_one(self, patent):
+        """Fetches and parses a single patent, storing its status and parsed data."""
+        error_status, html_content, tree, url = await self._fetch_page(patent)
+        self.add_scrape_status(patent, error_status)
+        if error_status == 'Success':
+            self._store_parsed(patent, self._parse_page(html_content, tree, patent, url))
+        else:
+            self._store_parsed(patent, {'error': error_status})
+
+    async def scrape_all_patents(self, progress_callback=None):
+        """
+        Scrapes all patents in the list self.list_of_patents concurrently.
+
+        Each patent is scraped as its own task; the context pool caps how many run at
+        once, so wall time is bounded by the slowest patents rather than their sum.
+
+        Args:
+            progress_callback (callable, optional): Called as progress_callback(done, total)
+                each time a patent finishes.
+        """
         if not self.list_of_patents:
             raise NoPatentsError("No patents to scrape. Add patents using scraper.add_patents()")
-            
-        for patent in self.list_of_patents:
-            error_status, soup, url = self.request_single_patent(patent)
-            self.add_scrape_status(patent, error_status)
-            if error_status == 'Success':
-                self.parsed_patents[patent] = self.get_scraped_data(soup, patent, url)
-            else:
-                self.parsed_patents[patent] = {'error': error_status}
 
+        total = len(self.list_of_patents)
+        done = 0
+
+        async def scrape_and_report(patent):
+            nonlocal done
+            try:
+                await self._scrape_one(patent)
+            finally:
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+
+        results = await asyncio.gather(*(scrape_and_report(patent) for patent in self.list_of_patents),
+                                       return_exceptions=True)
+        for patent, result in zip(self.list_of_patents, results):
+            if isinstance(result, Exception):
+                error_msg = f'An unexpected error occurred: {result}'
+                self.add_scrape_status(patent, error_msg)
+                self._store_parsed(patent, {'error': error_msg})
 
 
 async def main():
-    # Using a 'with' statement is recommended to ensure the browser closes properly.
-    with scraper_class(return_abstract=True, return_claims=True, headless=True) as scraper:
+    # Using an 'async with' statement is recommended to ensure the browser closes properly.
+    async with scraper_class(return_abstract=True, return_claims=True, headless=True) as scraper:
         
         # Add the patents you want to scrape
         scraper.add_patents('US2014262394')
@@ -347,11 +674,12 @@ async def main():
         # scraper.add_patents('US-11000000-B2') # Example with a different format
 
         # Scrape all patents in the list
-        scraper.scrape_all_patents()
+        await scraper.scrape_all_patents()
 
         # Print the results
         print("\n--- Scraping Results ---")
-        for patent_id, data in scraper.parsed_patents.items():
+        for patent_id in scraper.parsed_patents:
+            data = scraper.get_parsed(patent_id)
             print(f"\n--- Data for Patent: {patent_id} ---")
             if 'error' in data:
                 print(f"Failed to scrape: {data['error']}")
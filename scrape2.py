@@ -1,10 +1,47 @@
 # main.py
 import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import gzip
+import html
 import json
-import requests
-from bs4 import BeautifulSoup
+import logging
+import os
+import re
+import tempfile
+import time
+import aiohttp
+import lxml.html
+import orjson
+from lxml import etree
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
+log = logging.getLogger(__name__)
+
+# Age in seconds after which a cached patent is scraped again (patent pages rarely change).
+DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Bumped whenever the shape of a parsed patent changes, so older cache entries are ignored.
+_CACHE_VERSION = 2
+
+@functools.lru_cache(maxsize=4096)
+def normalize(patent):
+    """Turns user input such as ' us-11000000-b2 ' into the form used in patent URLs ('US11000000B2')."""
+    return patent.strip().replace('-', '').replace(' ', '').upper()
+
+
+@functools.lru_cache(maxsize=4096)
+def canonical_url(patent):
+    """The server-rendered page for a patent, e.g. https://patents.google.com/patent/US11000000B2/en."""
+    return f"https://patents.google.com/patent/{normalize(patent)}/en"
+
+
+@functools.lru_cache(maxsize=4096)
+def search_url(patent):
+    """The search URL that Google Patents redirects to the patent's page."""
+    return f"https://patents.google.com/?oq={patent}"
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 #                 Custom Errors
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
@@ -17,6 +54,352 @@ class NoPatentsError(Exception):
     """Custom exception for when no patents are provided to scrape."""
     pass
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+#             Compiled XPath Selectors
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+_XP_TITLE = etree.XPath('//meta[@name="DC.title"]/@content')
+_XP_ITEMPROP = etree.XPath('//*[@itemprop]')
+_XP_FILING_DATE_TIME = etree.XPath('.//time')
+
+_XP_EVENT_TYPE = etree.XPath('.//span[@itemprop="type"]')
+_XP_EVENT_DATE = etree.XPath('.//time[@itemprop="date"]')
+_XP_EVENT_TITLE = etree.XPath('.//span[@itemprop="title"]')
+
+# All three citation cells of a row in one query, in document order.
+_XP_CITE_FIELDS = etree.XPath(
+    './/span[@itemprop="publicationNumber"] | .//td[@itemprop="priorityDate"] | .//td[@itemprop="publicationDate"]'
+)
+_CITE_FIELD_NAMES = {
+    ('span', 'publicationNumber'): 'patent_number',
+    ('td', 'priorityDate'): 'priority_date',
+    ('td', 'publicationDate'): 'publication_date',
+}
+
+_XP_CLASS_LEAF = etree.XPath('.//meta[@itemprop="Leaf"][@content="true"]')
+_XP_CLASS_CODE = etree.XPath('.//span[@itemprop="Code"]')
+_XP_CLASS_DESCRIPTION = etree.XPath('.//span[@itemprop="Description"]')
+
+# Same match as the CSS selector "section.abstract > div.abstract".
+_XP_ABSTRACT = etree.XPath(
+    '//section[contains(concat(" ", normalize-space(@class), " "), " abstract ")]'
+    '/div[contains(concat(" ", normalize-space(@class), " "), " abstract ")]'
+)
+
+# (tag, itemprop) of every top-level element process_patent_html reads, mapped to its bucket.
+_ITEMPROP_BUCKETS = {
+    ('dd', 'inventor'): 'inventor',
+    ('dd', 'assigneeOriginal'): 'assignee_orig',
+    ('dd', 'assigneeCurrent'): 'assignee_current',
+    ('dd', 'publicationDate'): 'publication_date',
+    ('dd', 'publicationNumber'): 'publication_number',
+    ('dd', 'applicationNumber'): 'application_number',
+    ('dd', 'filingDate'): 'filing_date',
+    ('dd', 'legalStatusIfi'): 'legal_status',
+    ('dd', 'events'): 'events',
+    ('tr', 'forwardReferencesOrig'): 'forward_cites_orig',
+    ('tr', 'forwardReferencesFamily'): 'forward_cites_family',
+    ('tr', 'backwardReferences'): 'backward_cites_orig',
+    ('tr', 'backwardReferencesFamily'): 'backward_cites_family',
+    ('li', 'classifications'): 'classifications',
+    ('section', 'description'): 'description',
+    ('section', 'claims'): 'claims',
+}
+
+
+def _text(element, separator=''):
+    """Joins the stripped, non-empty text nodes of an element (mirrors bs4's get_text(strip=True))."""
+    if len(element) == 0:
+        # A leaf (most dates, numbers and citation cells) has a single text node.
+        return (element.text or '').strip()
+    return separator.join(filter(None, map(str.strip, element.itertext())))
+
+
+def _collect_itemprops(tree):
+    """
+    Sorts every itemprop element of a page into buckets in a single document pass.
+
+    Returns:
+        dict: Maps each bucket name in _ITEMPROP_BUCKETS to its elements, in document order.
+    """
+    buckets = {name: [] for name in _ITEMPROP_BUCKETS.values()}
+    for element in _XP_ITEMPROP(tree):
+        name = _ITEMPROP_BUCKETS.get((element.tag, element.get('itemprop')))
+        if name is not None:
+            buckets[name].append(element)
+    return buckets
+
+
+def _first_text(elements):
+    """Returns the text of the first element in an XPath result, or '' if there is none."""
+    return _text(elements[0]) if elements else ''
+
+def parse_citation(single_citation):
+    """Parses a single patent citation from a table row element."""
+    citation = {'patent_number': '', 'priority_date': '', 'publication_date': ''}
+    seen = set()
+    for cell in _XP_CITE_FIELDS(single_citation):
+        name = _CITE_FIELD_NAMES[(cell.tag, cell.get('itemprop'))]
+        if name not in seen:
+            seen.add(name)
+            citation[name] = _text(cell)
+    return citation
+
+
+def _parse_metadata(tree, found):
+    """
+    Extracts every field except the abstract, description and claims texts, which are left empty.
+
+    Inventors, assignees, citations and classifications are plain lists; use to_json()
+    to get the JSON-string form.
+    """
+    title = _XP_TITLE(tree)
+    title_text = title[0].rstrip() if title else ''
+
+    inventor_name = [_text(x) for x in found['inventor']]
+    assignee_name_orig = [_text(x) for x in found['assignee_orig']]
+    assignee_name_current = [_text(x) for x in found['assignee_current']]
+
+    publication_date = _first_text(found['publication_date'])
+    publication_number = found['publication_number']
+    publication_number = ''.join(publication_number[0].itertext()) if publication_number else ''
+    application_number = _first_text(found['application_number'])
+    filing_date_element = found['filing_date']
+    filing_date = _first_text(_XP_FILING_DATE_TIME(filing_date_element[0])) if filing_date_element else ''
+    legal_status_ifi = _first_text(found['legal_status'])
+
+    priority_date, granted_date, expiration_date = '', '', ''
+    for event in found['events']:
+        event_type = _XP_EVENT_TYPE(event)
+        event_date = _XP_EVENT_DATE(event)
+        if not event_type or not event_date:
+            continue
+        event_type = _text(event_type[0])
+        event_date = _text(event_date[0])
+        if event_type == 'priority': priority_date = event_date
+        elif event_type == 'granted': granted_date = event_date
+        elif event_type == 'publication' and not publication_date: publication_date = event_date
+        event_title_span = _XP_EVENT_TITLE(event)
+        if event_title_span and 'expiration' in _text(event_title_span[0]).lower():
+            expiration_date = event_date
+
+    forward_cites_no_family = [parse_citation(c) for c in found['forward_cites_orig']]
+    forward_cites_yes_family = [parse_citation(c) for c in found['forward_cites_family']]
+    backward_cites_no_family = [parse_citation(c) for c in found['backward_cites_orig']]
+    backward_cites_yes_family = [parse_citation(c) for c in found['backward_cites_family']]
+
+    classifications = []
+    for item in found['classifications']:
+        if _XP_CLASS_LEAF(item):
+            code = _XP_CLASS_CODE(item)
+            description = _XP_CLASS_DESCRIPTION(item)
+            if code and description:
+                classifications.append({'code': _text(code[0]), 'description': _text(description[0])})
+
+    return {
+        'title': title_text, 
+        'inventor_name': inventor_name,
+        'assignee_name_orig': assignee_name_orig,
+        'assignee_name_current': assignee_name_current,
+        'publication_date': publication_date, 
+        'priority_date': priority_date,
+        'granted_date': granted_date, 
+        'filing_date': filing_date, 
+        'expiration_date': expiration_date,
+        'application_number': application_number, 
+        'publication_number': publication_number,
+        'legal_status': legal_status_ifi,
+        'forward_cite_no_family': forward_cites_no_family,
+        'forward_cite_yes_family': forward_cites_yes_family,
+        'backward_cite_no_family': backward_cites_no_family,
+        'backward_cite_yes_family': backward_cites_yes_family,
+        'classifications': classifications,
+        'abstract_text': '',
+        'description_text': '',
+        'claims_text': '',
+    }
+
+
+# Fields of a parsed patent that hold lists rather than plain strings.
+_LIST_FIELDS = (
+    'inventor_name', 'assignee_name_orig', 'assignee_name_current',
+    'forward_cite_no_family', 'forward_cite_yes_family',
+    'backward_cite_no_family', 'backward_cite_yes_family',
+    'classifications',
+)
+
+
+def to_json(parsed):
+    """
+    Serializes the list fields of a parsed patent to JSON strings.
+
+    Parsing keeps these fields as Python lists; call this only where string values
+    are required, e.g. when writing rows to a CSV file or database.
+
+    Args:
+        parsed (dict): A parsed patent as returned by get_scraped_data.
+
+    Returns:
+        dict: A copy of the patent with every list field encoded as a JSON string.
+    """
+    serialized = dict(parsed)
+    for field in _LIST_FIELDS:
+        if field in serialized:
+            serialized[field] = orjson.dumps(serialized[field]).decode('utf-8')
+    return serialized
+
+
+def _extract_abstract(tree, found):
+    abstract_element = _XP_ABSTRACT(tree)
+    return abstract_element[0].text_content().strip() if abstract_element else "Abstract not found"
+
+
+def _extract_description(tree, found):
+    description_html = found['description']
+    return _text(description_html[0], separator='\n') if description_html else ""
+
+
+def _extract_claims(tree, found):
+    claims_html = found['claims']
+    return _text(claims_html[0], separator='\n') if claims_html else ""
+
+
+@functools.lru_cache(maxsize=8)
+def make_parser(return_abstract=False, return_description=False, return_claims=False):
+    """
+    Returns a parse(tree) function that extracts only the requested text fields.
+
+    The flag checks happen once here rather than for every page; there are only eight
+    combinations, so each parser is built once and reused.
+    """
+    extractors = tuple(
+        (field, extract) for field, extract, wanted in (
+            ('abstract_text', _extract_abstract, return_abstract),
+            ('description_text', _extract_description, return_description),
+            ('claims_text', _extract_claims, return_claims),
+        ) if wanted
+    )
+
+    def parse(tree):
+        # One pass over the itemprop elements fills every bucket the extractors use.
+        found = _collect_itemprops(tree)
+        parsed_data = _parse_metadata(tree, found)
+        for field, extract in extractors:
+            parsed_data[field] = extract(tree, found)
+        return parsed_data
+
+    return parse
+
+
+def parse_patent_tree(tree, return_abstract=False, return_description=False, return_claims=False):
+    """Parses the full lxml tree of a patent page to extract key information."""
+    return make_parser(bool(return_abstract), bool(return_description), bool(return_claims))(tree)
+
+
+# Scalar fields read straight from the raw page bytes in fast_meta_only mode, with the
+# cleanup that matches what parse_patent_tree returns for each. These assume Google's
+# current markup and have only been compared with parse_patent_tree on saved pages; a
+# miss falls back to the full parse, but a markup change that still matches would not.
+_META_REGEXES = {
+    'title': (re.compile(rb'<meta name="DC\.title" content="([^"]*)"'), str.rstrip),
+    'publication_number': (re.compile(rb'<dd itemprop="publicationNumber"[^>]*>([^<]*)</dd>'), str),
+    'application_number': (re.compile(rb'<dd itemprop="applicationNumber"[^>]*>([^<]*)</dd>'), str.strip),
+    'legal_status': (re.compile(rb'<dd itemprop="legalStatusIfi"[^>]*>\s*<span itemprop="status">([^<]*)</span>\s*</dd>'), str.strip),
+}
+
+
+def _fast_meta(html_content, patent, url):
+    """
+    Extracts the title, publication/application numbers and legal status with regexes.
+
+    Returns:
+        dict or None: The fields plus 'url' and 'patent', or None if any pattern misses,
+                      in which case the page should be parsed normally.
+    """
+    meta = {}
+    for field, (regex, clean) in _META_REGEXES.items():
+        match = regex.search(html_content)
+        if match is None:
+            return None
+        try:
+            meta[field] = clean(html.unescape(match.group(1).decode('utf-8')))
+        except UnicodeDecodeError:
+            return None
+    meta['url'] = url
+    meta['patent'] = patent
+    return meta
+
+
+# Size of the slices a page is fed to the incremental parser in.
+_FEED_CHUNK = 64 * 1024
+
+
+def _build_tree(html_content, keep_description=True, keep_claims=True):
+    """
+    Parses a page incrementally, emptying the long sections the caller does not need.
+
+    The description and claims are most of a patent page. When they are not wanted, each
+    is cleared as soon as its closing tag is parsed, so the finished tree (and the itemprop
+    scan over it) only holds the metadata.
+    """
+    skip = {name for name, keep in (('description', keep_description), ('claims', keep_claims)) if not keep}
+    if not skip:
+        return lxml.html.fromstring(html_content)
+    parser = etree.HTMLPullParser(events=('end',), tag='section')
+    parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+    for start in range(0, len(html_content), _FEED_CHUNK):
+        parser.feed(html_content[start:start + _FEED_CHUNK])
+        for _, element in parser.read_events():
+            if element.get('itemprop') in skip:
+                element.clear(keep_tail=True)
+    return parser.close()
+
+
+def _parse_worker(html_content, patent, url, flags):
+    """
+    Parses a patent page from its raw HTML in a worker process.
+
+    Takes and returns only picklable values so it can run in a ProcessPoolExecutor.
+    flags is (return_abstract, return_description, return_claims). Parser errors are
+    re-raised as ValueError, since lxml exceptions do not survive pickling.
+    """
+    _, return_description, return_claims = flags
+    try:
+        tree = _build_tree(html_content, keep_description=return_description, keep_claims=return_claims)
+        parsed_data = parse_patent_tree(tree, *flags)
+    except (etree.ParserError, etree.XMLSyntaxError) as e:
+        raise ValueError(f'{type(e).__name__}: {e}') from None
+    parsed_data['url'] = url
+    parsed_data['patent'] = patent
+    return parsed_data
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+#             Shared HTTP session
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+# One connection pool for every scraper in the same async context.
+_session_cv = contextvars.ContextVar('session', default=None)
+
+
+async def get_session():
+    """Returns the aiohttp session of the current async context, creating it on first use."""
+    session = _session_cv.get()
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            headers={'User-Agent': 'Mozilla/5.0'},
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+        )
+        _session_cv.set(session)
+    return session
+
+
+async def close_session():
+    """Closes the session of the current async context, if there is one."""
+    session = _session_cv.get()
+    if session is not None:
+        _session_cv.set(None)
+        await session.close()
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 #             Create scraper class
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
@@ -43,8 +426,21 @@ class scraper_class:
     if __name__ == "__main__":
         asyncio.run(main())
     """
-    def __init__(self, return_abstract=False, return_description=False, return_claims=False, headless=True):
-        """Initializes the scraper's configuration."""
+    def __init__(self, return_abstract=False, return_description=False, return_claims=False, headless=True, concurrency=8,
+                 use_cache=True, cache_dir='.patent_cache', cache_ttl=DEFAULT_CACHE_TTL, max_concurrency=16,
+                 fast_meta_only=False):
+        """
+        Initializes the scraper's configuration.
+
+        concurrency caps how many pages are open in the shared browser context at once, and
+        max_concurrency how many patents are being fetched or parsed at once.
+        With use_cache, parsed patents are stored under cache_dir and reused for cache_ttl
+        seconds, skipping the network, the browser and the parser on later runs. Caching is
+        on by default, and the default cache_dir is relative to the working directory.
+        With fast_meta_only and no text fields requested, a patent fetched over plain HTTP is
+        only scanned with regexes for its title, publication/application numbers and legal
+        status; the result holds just those fields. Pages the regexes miss are parsed in full.
+        """
         self.list_of_patents = []
         self.scrape_status = {}
         self.parsed_patents = {}
@@ -54,16 +450,45 @@ class scraper_class:
         self.headless = headless
         self.playwright = None
         self.browser = None
+        self.context = None
+        self.concurrency = concurrency
+        self.sem = None
+        # Idle browser pages, reused across patents; at most `concurrency` are ever opened.
+        self._page_pool = None
+        self.max_concurrency = max_concurrency
+        self.task_sem = None
+        self.http = None
+        self._owns_http = False
+        self.pool = None
+        # patent -> canonical patent page URL, learned from the fast path or a browser redirect.
+        self._url_cache = {}
+        # patent -> task currently scraping it, so concurrent requests for it share one fetch.
+        self._inflight = {}
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.fast_meta_only = fast_meta_only
 
     async def __aenter__(self):
         """
         Asynchronous context manager entry.
         Initializes Playwright and the browser.
         """
-        print("Starting Playwright and launching browser...")
+        log.debug("Starting Playwright and launching browser...")
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        print("Browser launched.")
+        # One context shared by every page: cache and cookies are reused across patents.
+        self.context = await self.browser.new_context(user_agent='Mozilla/5.0', java_script_enabled=True)
+        self.sem = asyncio.Semaphore(self.concurrency)
+        self._page_pool = asyncio.Queue()
+        self.task_sem = asyncio.Semaphore(self.max_concurrency)
+        # Reuse the session of an enclosing scraper or pipeline; close it on exit only if we opened it.
+        current = _session_cv.get()
+        self._owns_http = current is None or current.closed
+        self.http = await get_session()
+        # Parsing is CPU-bound, so it runs in worker processes while the loop keeps fetching.
+        self.pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        log.debug("Browser launched.")
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -71,12 +496,20 @@ class scraper_class:
         Asynchronous context manager exit.
         Ensures resources are closed properly.
         """
-        print("Closing browser and Playwright resources...")
+        log.debug("Closing browser and Playwright resources...")
+        if self._owns_http:
+            await close_session()
+        while self._page_pool is not None and not self._page_pool.empty():
+            await self._page_pool.get_nowait().close()
+        if self.context:
+            await self.context.close()
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
-        print("Resources closed.")
+        if self.pool:
+            self.pool.shutdown()
+        log.debug("Resources closed.")
 
     def add_patents(self, patent):
         """Appends a patent to the list to be scraped."""
@@ -89,203 +522,251 @@ class scraper_class:
         if patent in self.list_of_patents:
             self.list_of_patents.remove(patent)
         else:
-            print(f'Patent {patent} not in patent list')
+            log.warning('Patent %s not in patent list', patent)
 
     def add_scrape_status(self, patent, success_value):
         """Adds the status of a scrape to the dictionary."""
         self.scrape_status[patent] = success_value
 
+    def _cache_path(self, patent):
+        """Returns the cache file for a patent and the current output flags."""
+        safe_key = re.sub(r'[^\w.-]', '_', normalize(patent))
+        flags = ''.join('1' if flag else '0' for flag in (self.return_abstract, self.return_description, self.return_claims))
+        if self.fast_meta_only:
+            flags += 'm'
+        return os.path.join(self.cache_dir, f'{safe_key}-{flags}.v{_CACHE_VERSION}.json.gz')
+
+    def _read_cache(self, patent):
+        """Returns the cached parsed data for a patent, or None on a miss or an expired entry."""
+        if not self.use_cache:
+            return None
+        path = self._cache_path(patent)
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with gzip.open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, patent, parsed_data):
+        """Writes parsed data to the cache atomically so readers never see a partial file."""
+        if not self.use_cache:
+            return
+        path = self._cache_path(patent)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wb') as f:
+                f.write(orjson.dumps(parsed_data))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning('Could not write cache entry %s: %s', path, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    async def _fast_fetch(self, patent):
+        """
+        Fetches the patent page directly with a plain HTTP GET, skipping the browser.
+
+        The page at the canonical /patent/<number>/en URL is server-rendered, so Playwright is
+        only needed to resolve the search redirect when this fails: on a network error, a
+        non-200 response, an empty body, or a page without a title.
+
+        Returns:
+            tuple or None: (final_url, html_content), or None if the browser should be used.
+        """
+        url = self._url_cache.get(patent) or canonical_url(patent)
+        try:
+            async with self.http.get(url, timeout=aiohttp.ClientTimeout(total=20)) as response:
+                if response.status != 200:
+                    log.debug('Patent: %s, fast fetch returned %s, falling back to browser', patent, response.status)
+                    return None
+                html_content = await response.read()
+                final_url = str(response.url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.debug('Patent: %s, fast fetch failed (%r), falling back to browser', patent, e)
+            return None
+        if not html_content.strip():
+            log.debug('Patent: %s, fast fetch returned an empty body, falling back to browser', patent)
+            return None
+        return final_url, html_content
+
+    async def _parse(self, html_content, patent, url):
+        """
+        Parses a page in the process pool and returns the data get_scraped_data would.
+
+        If a worker has died and broken the pool, the page is parsed in a thread instead.
+        """
+        flags = (self.return_abstract, self.return_description, self.return_claims)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.pool, _parse_worker, html_content, patent, url, flags)
+        except concurrent.futures.BrokenExecutor:
+            log.warning('Patent: %s, parse worker pool is broken, parsing in a thread', patent)
+            return await asyncio.to_thread(_parse_worker, html_content, patent, url, flags)
+
     async def request_single_patent(self, patent):
         """
         Fetches a single patent page asynchronously.
 
+        A plain HTTP request to the canonical patent URL is tried first; Playwright is only
+        used to resolve the search redirect when that does not return a usable page.
+
         Args:
             patent (str): The patent number.
 
         Returns:
             tuple: A tuple containing the patent number and the result dictionary.
                    The result will contain either the parsed data or an error message.
+                   Concurrent calls for the same patent share a single fetch.
         """
-        initial_url = f"https://patents.google.com/?oq={patent}"
-        print(f"🚀 Starting scrape for: {patent} at {initial_url}")
+        task = self._inflight.get(patent)
+        if task is None:
+            task = asyncio.ensure_future(self._request_single_patent(patent))
+            self._inflight[patent] = task
+            task.add_done_callback(lambda _: self._inflight.pop(patent, None))
+        # Shielded so that cancelling one caller does not cancel the fetch for the others.
+        return await asyncio.shield(task)
+
+    async def _request_single_patent(self, patent):
+        """Does the work of request_single_patent for a patent that is not already in flight."""
+        async with self.task_sem:
+            cached = self._read_cache(patent)
+            if cached is not None:
+                # Entries are keyed by normalize(patent); report the spelling asked for.
+                cached['patent'] = patent
+                self.add_scrape_status(patent, 'Success')
+                return patent, cached
+
+            patent, parsed_data = await self._scrape(patent)
+            if 'error' not in parsed_data:
+                self._write_cache(patent, parsed_data)
+            return patent, parsed_data
+
+    async def _scrape(self, patent):
+        """Fetches and parses a patent, over plain HTTP if possible and in the browser otherwise."""
+        fetched = await self._fast_fetch(patent)
+        if fetched is not None:
+            final_url, html_content = fetched
+            parsed_data = None
+            try:
+                if self.fast_meta_only and not (self.return_abstract or self.return_description or self.return_claims):
+                    parsed_data = _fast_meta(html_content, patent, final_url)
+                if parsed_data is None:
+                    parsed_data = await self._parse(html_content, patent, final_url)
+            except Exception as e:
+                # Includes BrokenProcessPool; the browser path below still works without the pool.
+                log.debug('Patent: %s, parsing the fast fetch failed (%r), falling back to browser', patent, e)
+                parsed_data = None
+            # A page without a title is not a patent page; let the browser resolve it.
+            if parsed_data is not None and parsed_data['title']:
+                self._url_cache[patent] = final_url
+                self.add_scrape_status(patent, 'Success')
+                return patent, parsed_data
+
+        initial_url = search_url(patent)
+        log.debug("Starting browser scrape for: %s at %s", patent, initial_url)
         
+        async with self.sem:
+            return await self._scrape_in_page(patent, initial_url)
+
+    async def _checkout_page(self):
+        """Returns an idle page from the pool, opening a new one if none is free."""
+        try:
+            return self._page_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            return await self.context.new_page()
+
+    async def _return_page(self, page):
+        """Blanks a page and puts it back in the pool, closing it instead if it cannot be reset."""
+        try:
+            await page.goto('about:blank')
+        except Exception as e:
+            log.debug('Discarding browser page that could not be reset: %s', e)
+            try:
+                await page.close()
+            except Exception as e:
+                log.warning('Failed to close browser page: %s', e)
+            return
+        self._page_pool.put_nowait(page)
+
+    async def _scrape_in_page(self, patent, initial_url):
+        """Loads and parses one patent in a pooled page of the shared context. Called while holding self.sem."""
         page = None
+        final_url = initial_url
         try:
-            page = await self.browser.new_page()
+            page = await self._checkout_page()
             await page.goto(initial_url, wait_until='load', timeout=60000)
             final_url = page.url
-            print(f"➡️ Redirected to: {final_url} for patent {patent}")
+            log.debug("Redirected to: %s for patent %s", final_url, patent)
+            self._url_cache[patent] = final_url
             
-            # *** FIX: Explicitly wait for a key element to be visible. ***
-            # This is the crucial step. We wait for the element containing the publication
-            # date to appear. This ensures the page's JavaScript has finished rendering
-            # the dynamic content before we try to parse the HTML.
-
-            # print(f"⏳ Waiting for content to load for patent {patent}...")
-            # await page.wait_for_selector('dd[itemprop="assigneeCurrent"]', timeout=10000)
-            # print(f"✅ Content loaded for patent {patent}.")
-            # html_content = await page.content()
-            # soup = BeautifulSoup(html_content, "lxml")
-
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(final_url, headers=headers, timeout=20)
-            response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
-            soup = BeautifulSoup(response.content, features="lxml")
+            # Wait for the element containing the publication date so the page's
+            # JavaScript has finished rendering before we read the HTML. The page
+            # Playwright already loaded is parsed directly instead of downloading
+            # final_url a second time.
+            await page.wait_for_selector('[itemprop="publicationDate"]', state='attached', timeout=15000)
+            html_content = await page.content()
             
             # Process the data and return it
-            parsed_data = self.get_scraped_data(soup, patent, final_url)
+            parsed_data = await self._parse(html_content, patent, final_url)
             self.add_scrape_status(patent, 'Success')
-            await page.close()
             return patent, parsed_data
 
         except PlaywrightTimeoutError:
             error_msg = f'Timeout Error: Could not find key content on page {final_url}. The page might not be a valid patent page or took too long to load.'
-            print(f'❌ Patent: {patent}, {error_msg}')
-            if page: await page.close()
+            log.warning('Patent: %s, %s', patent, error_msg)
             self.add_scrape_status(patent, error_msg)
             return patent, {'error': error_msg}
         except Exception as e:
             error_msg = f'An unexpected error occurred: {e}'
-            print(f'❌ Patent: {patent}, {error_msg}')
-            if page: await page.close()
+            log.warning('Patent: %s, %s', patent, error_msg)
             self.add_scrape_status(patent, error_msg)
             return patent, {'error': error_msg}
+        finally:
+            if page is not None:
+                await self._return_page(page)
 
     def parse_citation(self, single_citation):
         """Parses a single patent citation from a table row element."""
-        try:
-            patent_number = single_citation.find('span', itemprop='publicationNumber').get_text(strip=True)
-        except AttributeError:
-            patent_number = ''
-        try:
-            priority_date = single_citation.find('td', itemprop='priorityDate').get_text(strip=True)
-        except AttributeError:
-            priority_date = ''
-        try:
-            publication_date = single_citation.find('td', itemprop='publicationDate').get_text(strip=True)
-        except AttributeError:
-            publication_date = ''
-        return {'patent_number': patent_number, 'priority_date': priority_date, 'publication_date': publication_date}
-
-    def process_patent_html(self, soup):
-        """Parses the full HTML of a patent page to extract key information."""
-        try:
-            # Using a more specific selector for the title
-            # title_element = soup.find('h1', id='title')
-            # title_text = title_element.get_text(strip=True) if title_element else ''
-            title = soup.find('meta',attrs={'name':'DC.title'})
-            title_text=title['content'].rstrip()
-        except (TypeError, KeyError, AttributeError):
-            title_text = ''
+        return parse_citation(single_citation)
 
+    def process_patent_html(self, tree):
+        """Parses the full lxml tree of a patent page to extract key information."""
+        return parse_patent_tree(tree, self.return_abstract, self.return_description, self.return_claims)
 
-        inventor_name = [x.get_text(strip=True) for x in soup.find_all('dd', itemprop='inventor')]
-        assignee_name_orig = [x.get_text(strip=True) for x in soup.find_all('dd', itemprop='assigneeOriginal')]
-        assignee_name_current = [x.get_text(strip=True) for x in soup.find_all('dd', itemprop='assigneeCurrent')]
-
-        try:
-            publication_date = soup.find('dd', itemprop='publicationDate').get_text(strip=True)
-        except AttributeError:
-            publication_date = ''
-        try:
-            publication_number = soup.find('dd',itemprop="publicationNumber").get_text()
-        except:
-            publication_number = ''
-        try:
-            application_number = soup.find('dd', itemprop="applicationNumber").get_text(strip=True)
-        except AttributeError:
-            application_number = ''
-        try:
-            filing_date_element = soup.find('dd', itemprop='filingDate')
-            filing_date = filing_date_element.find('time').get_text(strip=True) if filing_date_element else ''
-        except AttributeError:
-            filing_date = ''
-        try:
-            legal_status_ifi = soup.find('dd', itemprop='legalStatusIfi').get_text(strip=True)
-        except AttributeError:
-            legal_status_ifi = ''
-
-        priority_date, granted_date, expiration_date = '', '', ''
-        for event in soup.find_all('dd', itemprop='events'):
-            try:
-                event_type = event.find('span', itemprop='type').get_text(strip=True)
-                event_date = event.find('time', itemprop='date').get_text(strip=True)
-                if event_type == 'priority': priority_date = event_date
-                elif event_type == 'granted': granted_date = event_date
-                elif event_type == 'publication' and not publication_date: publication_date = event_date
-                event_title_span = event.find('span', itemprop='title')
-                if event_title_span and 'expiration' in event_title_span.get_text(strip=True).lower():
-                    expiration_date = event_date
-            except AttributeError:
-                continue
-
-        forward_cites_no_family = [self.parse_citation(c) for c in soup.find_all('tr', itemprop="forwardReferencesOrig")]
-        forward_cites_yes_family = [self.parse_citation(c) for c in soup.find_all('tr', itemprop="forwardReferencesFamily")]
-        backward_cites_no_family = [self.parse_citation(c) for c in soup.find_all('tr', itemprop='backwardReferences')]
-        backward_cites_yes_family = [self.parse_citation(c) for c in soup.find_all('tr', itemprop='backwardReferencesFamily')]
-
-        classifications = []
-        for item in soup.find_all('li', itemprop='classifications'):
-            if item.find('meta', itemprop='Leaf', content='true'):
-                try:
-                    code = item.find('span', itemprop='Code').get_text(strip=True)
-                    description = item.find('span', itemprop='Description').get_text(strip=True)
-                    classifications.append({'code': code, 'description': description})
-                except AttributeError:
-                    continue
-        
-        abstract_text, description_text, claims_text = '', '', ''
-        if self.return_abstract:
-            abstract_element = soup.select_one("section.abstract > div.abstract")
-            abstract_text = abstract_element.text.strip() if abstract_element else "Abstract not found"
-        if self.return_description:
-            description_html = soup.find('section', itemprop='description')
-            description_text = description_html.get_text(separator='\n', strip=True) if description_html else ""
-        if self.return_claims:
-            claims_html = soup.find('section', itemprop='claims')
-            claims_text = claims_html.get_text(separator='\n', strip=True) if claims_html else ""
-
-        return {
-            'title': title_text, 
-            'inventor_name': json.dumps(inventor_name, ensure_ascii=False),
-            'assignee_name_orig': json.dumps(assignee_name_orig, ensure_ascii=False),
-            'assignee_name_current': json.dumps(assignee_name_current, ensure_ascii=False),
-            'publication_date': publication_date, 
-            'priority_date': priority_date,
-            'granted_date': granted_date, 
-            'filing_date': filing_date, 
-            'expiration_date': expiration_date,
-            'application_number': application_number, 
-            'publication_number': publication_number,
-            'legal_status': legal_status_ifi,
-            'forward_cite_no_family': json.dumps(forward_cites_no_family, ensure_ascii=False),
-            'forward_cite_yes_family': json.dumps(forward_cites_yes_family, ensure_ascii=False),
-            'backward_cite_no_family': json.dumps(backward_cites_no_family, ensure_ascii=False),
-            'backward_cite_yes_family': json.dumps(backward_cites_yes_family, ensure_ascii=False),
-            'classifications': json.dumps(classifications, ensure_ascii=False),
-            'abstract_text': abstract_text, 
-            'description_text': description_text, 
-            'claims_text': claims_text,
-        }
-
-    def get_scraped_data(self, soup, patent, url):
-        """Processes the soup and adds metadata."""
-        parsed_data = self.process_patent_html(soup)
+    def get_scraped_data(self, tree, patent, url):
+        """Processes the lxml tree and adds metadata."""
+        parsed_data = self.process_patent_html(tree)
         parsed_data['url'] = url
         parsed_data['patent'] = patent
         return parsed_data
 
+    async def _scrape_isolated(self, patent):
+        """Runs request_single_patent, turning an escaped exception into this patent's error entry."""
+        try:
+            return await self.request_single_patent(patent)
+        except Exception as e:
+            error_msg = f'An unexpected error occurred: {e}'
+            log.warning('Patent: %s, %s', patent, error_msg)
+            self.add_scrape_status(patent, error_msg)
+            return patent, {'error': error_msg}
+
     async def scrape_all_patents(self):
         """
-        Scrapes all patents in the list concurrently.
+        Scrapes all patents in the list concurrently, at most max_concurrency at a time.
+
+        A patent that fails gets an {'error': ...} entry instead of cancelling the others.
         """
         if not self.list_of_patents:
             raise NoPatentsError("No patents to scrape. Add patents using scraper.add_patents()")
         
-        tasks = [self.request_single_patent(patent) for patent in self.list_of_patents]
-        results = await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(self._scrape_isolated(patent)) for patent in self.list_of_patents]
         
-        for patent_id, data in results:
+        for task in tasks:
+            patent_id, data = task.result()
             self.parsed_patents[patent_id] = data
 
 async def main():
@@ -1,9 +1,12 @@
 # main.py
+import logging
 import asyncio
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-from bs4 import BeautifulSoup
+from lxml import etree
 import requests
 
+log = logging.getLogger(__name__)
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 #              Custom Errors
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
@@ -12,6 +15,56 @@ class PatentScrapingError(Exception):
     """Custom exception for errors during the patent scraping process."""
     pass
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+#              Streaming Extraction
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+# (tag, itemprop) of each field we keep, mapped to the separator used to join its text.
+_TARGET_FIELDS = {
+    ('dd', 'publicationNumber'): '',
+    ('section', 'description'): '\n',
+}
+
+def _element_text(element, separator):
+    """Joins the stripped, non-empty text nodes of an element."""
+    return separator.join(t.strip() for t in element.itertext() if t.strip())
+
+def _extract_fields(stream):
+    """
+    Streams a patent page through lxml's iterparse and returns the text of the target fields.
+
+    Only the subtrees listed in _TARGET_FIELDS are kept long enough to read their text;
+    everything else is cleared as soon as it has been parsed, so memory stays proportional
+    to the document depth rather than its size. Parsing stops once every field is found.
+
+    Args:
+        stream: A file-like object yielding the raw HTML bytes.
+
+    Returns:
+        dict: Maps each found itemprop to its text.
+    """
+    fields = {}
+    open_targets = 0
+    for event, elem in etree.iterparse(stream, events=('start', 'end'), html=True):
+        key = (elem.tag, elem.get('itemprop'))
+        is_target = key in _TARGET_FIELDS
+        if event == 'start':
+            open_targets += is_target
+            continue
+
+        if is_target:
+            open_targets -= 1
+            fields.setdefault(key[1], _element_text(elem, _TARGET_FIELDS[key]))
+            if len(fields) == len(_TARGET_FIELDS):
+                break
+
+        # Anything outside a target subtree is no longer needed.
+        if not open_targets:
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    return fields
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 #              Core Function
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
@@ -36,7 +89,7 @@ async def get_description(patent_number: str):
     if not isinstance(patent_number, str) or not patent_number:
         raise ValueError("The 'patent_number' must be a non-empty string.")
 
-    print(f"🚀 Starting scrape for: {patent_number}")
+    log.debug("Starting scrape for: %s", patent_number)
 
     async with async_playwright() as p:
         browser = None
@@ -55,8 +108,7 @@ async def get_description(patent_number: str):
             # *** THIS IS THE KEY STEP ***
             # Capture the final URL after any client-side redirects.
             final_url = page.url
-            print(f"➡️  Initial URL: {initial_url}")
-            print(f"✅ Final URL after redirect: {final_url}")
+            log.debug("Initial URL: %s, final URL after redirect: %s", initial_url, final_url)
 
             # # Get the page's HTML content now that we are on the correct page
             # html_content = await page.content()
@@ -66,20 +118,20 @@ async def get_description(patent_number: str):
 
             #######
             headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(final_url, headers=headers, timeout=20)
-            response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
-            soup = BeautifulSoup(response.content, features="lxml")
+            # Stream the body into the parser instead of materializing the whole page.
+            with requests.get(final_url, headers=headers, timeout=20, stream=True) as response:
+                response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
+                response.raw.decode_content = True
+                fields = _extract_fields(response.raw)
 
             # --- Extract Publication Number ---
             # This will now be the correct, final publication number.
-            publication_number_element = soup.find('dd', itemprop="publicationNumber")
-            publication_number = publication_number_element.get_text(strip=True) if publication_number_element else "Not Found"
+            publication_number = fields.get('publicationNumber', "Not Found")
 
             # --- Extract Description ---
-            description_element = soup.find('section', itemprop='description')
-            description_text = description_element.get_text(separator='\n', strip=True) if description_element else "Description not found."
+            description_text = fields.get('description', "Description not found.")
 
-            print(f"✅ Successfully scraped data for {patent_number}")
+            log.debug("Successfully scraped data for %s", patent_number)
             return {
                 'input_patent_number': patent_number,
                 'publication_number': publication_number,
@@ -89,12 +141,12 @@ async def get_description(patent_number: str):
 
         except PlaywrightTimeoutError:
             error_msg = f"Timeout Error: The page for patent '{patent_number}' took too long to load or did not have the expected content."
-            print(f"❌ {error_msg}")
+            log.debug(error_msg)
             raise PatentScrapingError(error_msg) from PlaywrightTimeoutError
 
         except Exception as e:
             error_msg = f"An unexpected error occurred: {e}"
-            print(f"❌ {error_msg}")
+            log.debug(error_msg)
             raise PatentScrapingError(error_msg) from e
         
         finally:
@@ -13,6 +13,14 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/rls542/patent_scraper/",
     packages=setuptools.find_packages(),
+    install_requires=[
+        "requests",
+        "beautifulsoup4",
+        "lxml",
+        "orjson",
+        # Lets requests advertise and decode brotli ("br") responses.
+        "brotli",
+    ],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
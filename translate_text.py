@@ -1,10 +1,191 @@
-# First, you need to install the requests library
-# You can do this by running: pip install requests
+# First, you need to install the aiohttp library
+# You can do this by running: pip install aiohttp brotli
+# (with brotli installed, aiohttp also accepts and decodes "br" compressed responses)
 
-import requests
+import asyncio
+import logging
+import aiohttp
 import urllib.parse
+from functools import lru_cache
 
-def translate_text(
+log = logging.getLogger(__name__)
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# One keep-alive connection pool shared by every call, opened on first use. It belongs to
+# the event loop that opened it, so callers must await close_session() before that loop
+# ends (e.g. at the end of the coroutine passed to asyncio.run).
+_SESSION = None
+_SESSION_LOOP = None
+
+def _get_session() -> aiohttp.ClientSession:
+    """Returns the shared session, opening a new one if there is none for the running event loop."""
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        if _SESSION is not None and not _SESSION.closed:
+            log.warning("Opening a new translation session; the previous event loop's session "
+                        "was not closed. Await close_session() before the event loop ends.")
+        _SESSION = aiohttp.ClientSession(headers=_HEADERS)
+        _SESSION_LOOP = loop
+    return _SESSION
+
+async def close_session() -> None:
+    """Closes the shared session. Call this before the event loop shuts down."""
+    global _SESSION
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
+
+# The endpoint rejects overly long URLs, so batches are cut at roughly this many encoded characters.
+_MAX_BATCH_CHARS = 5000
+
+@lru_cache(maxsize=1024)
+def _cached_quote(text: str) -> str:
+    """Percent-encodes text for a URL, remembering recent results."""
+    return urllib.parse.quote(text)
+
+@lru_cache(maxsize=1024)
+def _google_url(text: str, target_language: str, source_language: str) -> str:
+    """Builds the Google gtx endpoint URL for a single text."""
+    return f"https://translate.googleapis.com/translate_a/single?client=gtx&sl={source_language}&tl={target_language}&dt=t&q={_cached_quote(text)}"
+
+async def _google_single(text: str, target_language: str, source_language: str) -> str:
+    """Translates one text with the Google translate_a/single endpoint."""
+    async with _get_session().get(_google_url(text, target_language, source_language)) as response:
+        response.raise_for_status()
+        result_json = await response.json(content_type=None)
+
+    translated_segments = [segment[0] for segment in result_json[0] if segment[0]]
+    return "".join(translated_segments)
+
+# google_translator.py has its own sync batching for the same endpoint. It is not imported
+# here because it would pull in requests, httpx and orjson for an aiohttp-only script.
+def _first_string(item):
+    """Unwraps a batch result entry, which is either the translation or [translation, detected_language]."""
+    while isinstance(item, list) and item:
+        item = item[0]
+    return item
+
+def _batches(texts: list) -> list:
+    """Groups texts so the encoded q= parameters of each batch stay under _MAX_BATCH_CHARS."""
+    batches, current, current_len = [], [], 0
+    for text in texts:
+        encoded_len = len(_cached_quote(text)) + len("&q=")
+        if current and current_len + encoded_len > _MAX_BATCH_CHARS:
+            batches.append(current)
+            current, current_len = [], 0
+        current.append(text)
+        current_len += encoded_len
+    if current:
+        batches.append(current)
+    return batches
+
+async def translate_texts(texts: list, target_language: str, source_language: str) -> list:
+    """
+    Translates many texts with Google, one HTTP request per batch.
+
+    Each batch repeats the `q=` parameter on the translate_a/t endpoint. A batch that the
+    endpoint rejects (HTTP 400) or whose result does not line up with its inputs falls
+    back to one request per text.
+
+    Args:
+        texts (list): The texts to be translated.
+        target_language (str): The language code for the target language (e.g., 'en', 'es').
+        source_language (str): The language code for the source language (e.g., 'auto', 'zh-CN', 'fr').
+
+    Returns:
+        list: The translated texts, in the same order as the input.
+
+    Raises:
+        aiohttp.ClientError: If there is a network-related error.
+    """
+    translations = []
+    for batch in _batches(texts):
+        if len(batch) > 1:
+            query = "&".join(f"q={_cached_quote(text)}" for text in batch)
+            url = f"https://translate.googleapis.com/translate_a/t?client=gtx&sl={source_language}&tl={target_language}&{query}"
+            async with _get_session().get(url) as response:
+                if response.status == 400:
+                    items = None
+                else:
+                    response.raise_for_status()
+                    try:
+                        items = await response.json(content_type=None)
+                    except ValueError:
+                        items = None
+            if isinstance(items, list) and len(items) == len(batch):
+                batch_translations = [_first_string(item) for item in items]
+                if all(isinstance(t, str) for t in batch_translations):
+                    translations.extend(batch_translations)
+                    continue
+
+        translations.extend(await asyncio.gather(*(_google_single(text, target_language, source_language) for text in batch)))
+    return translations
+
+# Microsoft's (Bing) endpoint uses a POST request
+_MS_URL = "https://www.bing.com/ttranslatev3?isVertical=1&&IG=C013430A3596491FB22C3554A9855479&IID=translator.5028.1"
+
+async def _microsoft_single(text: str, target_language: str, source_language: str) -> str:
+    """Translates one text with a form-encoded POST to the Bing endpoint."""
+    params = {'from': source_language, 'to': target_language}
+    async with _get_session().post(_MS_URL, params=params, data={'text': text}) as response:
+        response.raise_for_status()
+        result_json = await response.json(content_type=None)
+    return result_json[0]['translations'][0]['text']
+
+async def translate_texts_ms(texts: list, target_language: str, source_language: str) -> list:
+    """
+    Translates many texts with Microsoft, one HTTP request per batch.
+
+    Each batch is posted as a JSON array of {'Text': ...} objects. A batch that the
+    endpoint rejects (HTTP 400) or whose result does not line up with its inputs falls
+    back to one form-encoded request per text; other error statuses, such as 429, raise.
+
+    Args:
+        texts (list): The texts to be translated.
+        target_language (str): The language code for the target language (e.g., 'en', 'es').
+        source_language (str): The language code for the source language (e.g., 'auto', 'zh-Hans', 'fr').
+
+    Returns:
+        list: The translated texts, in the same order as the input.
+
+    Raises:
+        aiohttp.ClientError: If there is a network-related error.
+    """
+    # For auto-detection, Bing uses 'auto-detect'
+    if source_language == 'auto':
+        source_language = 'auto-detect'
+    params = {'from': source_language, 'to': target_language}
+
+    translations = []
+    for batch in _batches(texts):
+        if len(batch) > 1:
+            payload = [{'Text': text} for text in batch]
+            async with _get_session().post(_MS_URL, params=params, json=payload) as response:
+                if response.status == 400:
+                    items = None
+                else:
+                    response.raise_for_status()
+                    try:
+                        items = await response.json(content_type=None)
+                    except ValueError:
+                        items = None
+            if isinstance(items, list) and len(items) == len(batch):
+                try:
+                    batch_translations = [item['translations'][0]['text'] for item in items]
+                except (IndexError, TypeError, KeyError):
+                    batch_translations = None
+                if batch_translations is not None:
+                    translations.extend(batch_translations)
+                    continue
+
+        translations.extend(await asyncio.gather(*(_microsoft_single(text, target_language, source_language) for text in batch)))
+    return translations
+
+async def translate_text(
     text: str, 
     target_language: str, 
     source_language: str, 
@@ -13,6 +194,18 @@ def translate_text(
     """
     Translates text using an unofficial API endpoint from the specified engine.
 
+    Calls share one keep-alive connection pool, so many translations can run
+    concurrently with asyncio.gather. The pool is tied to the running event loop:
+    await close_session() before the loop ends, e.g.
+
+        async def main():
+            try:
+                print(await translate_text("你好世界", "en", "zh-CN"))
+            finally:
+                await close_session()
+
+        asyncio.run(main())
+
     DISCLAIMER: This method uses unofficial, reverse-engineered APIs. It may break
     or be rate-limited without warning. For production applications, using official
     APIs (Google Cloud Translate, Azure AI Translator) is strongly recommended.
@@ -28,94 +221,63 @@ def translate_text(
         str: The translated text, or an error message if translation fails.
         
     Raises:
-        requests.exceptions.RequestException: If there is a network-related error.
+        aiohttp.ClientError: If there is a network-related error.
         ValueError: If an unsupported engine is selected.
         Exception: If the API response format is unexpected.
     """
     
-    print(f"--- Translating with {engine.capitalize()} ---")
-    print(f"Original Text: '{text}'")
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    log.debug("Translating with %s: '%s'", engine, text)
 
     try:
         if engine == 'google':
-            # URL encode the text for the GET request
-            encoded_text = urllib.parse.quote(text)
-            url = f"https://translate.googleapis.com/translate_a/single?client=gtx&sl={source_language}&tl={target_language}&dt=t&q={encoded_text}"
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            result_json = response.json()
-            translated_segments = [segment[0] for segment in result_json[0] if segment[0]]
-            translated_text = "".join(translated_segments)
+            translated_text = (await translate_texts([text], target_language, source_language))[0]
 
         elif engine == 'microsoft':
-            # Microsoft's endpoint uses a POST request
-            url = f"https://www.bing.com/ttranslatev3?isVertical=1&&IG=C013430A3596491FB22C3554A9855479&IID=translator.5028.1"
-            # For auto-detection, Bing uses 'auto-detect'
-            if source_language == 'auto':
-                 source_language = 'auto-detect'
-
-            params = {'from': source_language, 'to': target_language}
-            data = {'text': text}
-            
-            response = requests.post(url, params=params, data=data, headers=headers)
-            response.raise_for_status()
-            
-            result_json = response.json()
-            translated_text = result_json[0]['translations'][0]['text']
+            translated_text = (await translate_texts_ms([text], target_language, source_language))[0]
 
         else:
             raise ValueError(f"Unsupported translation engine: '{engine}'. Please use 'google' or 'microsoft'.")
 
-        print(f"Translated Text: '{translated_text}'")
+        log.debug("Translated Text: '%s'", translated_text)
         return translated_text
 
-    except requests.exceptions.RequestException as e:
-        print(f"A network error occurred: {e}")
+    except aiohttp.ClientError as e:
+        log.warning("A network error occurred: %s", e)
         raise
     except (IndexError, TypeError, KeyError):
         error_message = f"Failed to parse the translation from the {engine} API response. The format may have changed."
-        print(error_message)
+        log.warning(error_message)
         raise Exception(error_message) from None
 
 
 # --- Example Usage ---
-if __name__ == "__main__":
-    
-    # Example 1: Translate from Chinese to English using Google
+async def _examples():
     source_text_cn = "你好世界"
-    try:
-        translate_text(source_text_cn, "en", "zh-CN", engine='google')
-    except Exception:
-        print("Translation failed for Example 1.")
-
-    print("\n" + "="*40 + "\n")
+    source_text_en = "This is a test of the Microsoft translation engine."
+    source_text_fr = "Bonjour le monde. J'espère que vous passez une bonne journée."
 
-    # Example 2: Translate from Chinese to English using Microsoft
+    # The four examples run concurrently over the shared connection pool, which is
+    # closed before asyncio.run() ends the event loop.
     try:
-        translate_text(source_text_cn, "en", "zh-Hans", engine='microsoft')
-        # Note: Microsoft often uses 'zh-Hans' for Simplified Chinese
-    except Exception:
-        print("Translation failed for Example 2.")
-
-    print("\n" + "="*40 + "\n")
+        results = await asyncio.gather(
+            # Example 1: Translate from Chinese to English using Google
+            translate_text(source_text_cn, "en", "zh-CN", engine='google'),
+            # Example 2: Translate from Chinese to English using Microsoft
+            # Note: Microsoft often uses 'zh-Hans' for Simplified Chinese
+            translate_text(source_text_cn, "en", "zh-Hans", engine='microsoft'),
+            # Example 3: Translate from English to Spanish using Microsoft
+            translate_text(source_text_en, "es", "en", engine='microsoft'),
+            # Example 4: Auto-detect source (French) and translate to German using Google
+            translate_text(source_text_fr, "de", "auto", engine='google'),
+            return_exceptions=True,
+        )
+    finally:
+        await close_session()
 
-    # Example 3: Translate from English to Spanish using Microsoft
-    source_text_en = "This is a test of the Microsoft translation engine."
-    try:
-        translate_text(source_text_en, "es", "en", engine='microsoft')
-    except Exception:
-        print("Translation failed for Example 3.")
-        
     print("\n" + "="*40 + "\n")
+    for number, result in enumerate(results, start=1):
+        if isinstance(result, Exception):
+            print(f"Translation failed for Example {number}.")
 
-    # Example 4: Auto-detect source (French) and translate to German using Google
-    source_text_fr = "Bonjour le monde. J'espère que vous passez une bonne journée."
-    try:
-        translate_text(source_text_fr, "de", "auto", engine='google')
-    except Exception:
-        print("Translation failed for Example 4.")
+if __name__ == "__main__":
+    asyncio.run(_examples())